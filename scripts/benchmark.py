@@ -0,0 +1,132 @@
+"""Time shortcap's startup and each render engine on the demo video.
+
+    python scripts/benchmark.py [video] [--renderers moviepy ass]
+        [--profiles draft social] [--repeat 3] [--font path]
+
+Startup is the time to import shortcap, and shortcap.emojis on its own,
+in a fresh interpreter, then the first load of the emoji lexicon.
+Captions come from synthetic word timings, so no transcription model runs
+and every renderer gets the same input.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from moviepy.editor import VideoFileClip  # noqa: E402
+
+from shortcap import add_captions, emojis  # noqa: E402
+from shortcap.add_captions import RENDERERS  # noqa: E402
+from shortcap.config import DEFAULT_ENCODING_PROFILE  # noqa: E402
+
+WORDS = (
+    "so today we are looking at the new build and honestly it runs "
+    "much faster than the last one which is great news for everyone"
+).split()
+
+
+def synthetic_segments(duration, word_duration=0.3, words_per_segment=8):
+    segments = []
+    t = 0.5
+    i = 0
+    while t + word_duration <= duration:
+        words = []
+        for _ in range(words_per_segment):
+            if t + word_duration > duration:
+                break
+            words.append(
+                {"word": WORDS[i % len(WORDS)], "start": t, "end": t + word_duration}
+            )
+            t += word_duration
+            i += 1
+        segments.append(
+            {
+                "start": words[0]["start"],
+                "end": words[-1]["end"],
+                "text": " ".join(word["word"] for word in words),
+                "words": words,
+            }
+        )
+        t += word_duration
+    return segments
+
+
+def import_times(module="shortcap"):
+    """Self and cumulative import time of every shortcap module, in ms."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip().startswith("shortcap"):
+            self_us = int(fields[0].rsplit(":", 1)[1])
+            times[fields[2].strip()] = (self_us / 1000, int(fields[1]) / 1000)
+    return times
+
+
+def startup():
+    times = import_times()
+    print(f"import shortcap: {times['shortcap'][1]:.0f} ms")
+    print(f"import shortcap.emojis: {times['shortcap.emojis'][0]:.1f} ms (self)")
+
+    start = time.perf_counter()
+    emojis.get_lexicon()
+    print(f"emoji lexicon first load: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shortcap renderers")
+    parser.add_argument("video", nargs="?", default="demo/anyme.mp4")
+    parser.add_argument("--renderers", nargs="+", default=list(RENDERERS))
+    parser.add_argument("--profiles", nargs="+", default=[DEFAULT_ENCODING_PROFILE])
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--font", default="shortcap/assets/fonts/SourceSans3-Black.ttf")
+    args = parser.parse_args()
+
+    startup()
+
+    with VideoFileClip(args.video) as video:
+        duration = video.duration
+    segments = synthetic_segments(duration)
+    print(f"{args.video}: {duration:.1f}s, {len(segments)} segments")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for renderer in args.renderers:
+            for profile in args.profiles:
+                output = os.path.join(tmp, f"{renderer}-{profile}.mp4")
+                timings = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    add_captions(
+                        args.video,
+                        output,
+                        segments=segments,
+                        font=args.font,
+                        language="en",
+                        renderer=renderer,
+                        profile=profile,
+                    )
+                    timings.append(time.perf_counter() - start)
+
+                best = min(timings)
+                size = os.path.getsize(output) / 1e6
+                print(
+                    f"{renderer:>8} {profile:>8}: {best:6.2f}s  "
+                    f"{duration / best:5.2f}x realtime  {size:6.2f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Generate the emoji lexicon data file from its editable source table.
+
+    python scripts/build_emoji_lexicon.py [scripts/emoji_lexicon.tsv]
+        [--output shortcap/assets/emoji_lexicon.json]
+
+The table has one row per emoji: id (as in the emoji pack), emoji, name
+and ";"-separated keywords (the name is used when empty and one word).
+The output holds the processed rows and the keyword index built from
+them, so shortcap only parses it, on the first emoji lookup.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from shortcap.emojis import (  # noqa: E402
+    LEXICON_PATH,
+    LEXICON_VERSION,
+    EmojiIndex,
+    process_and_flatten_array,
+)
+
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "emoji_lexicon.tsv")
+
+
+def read_rows(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
+        next(reader)  # header
+        return [row for row in reader if row]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the emoji lexicon data file")
+    parser.add_argument("source", nargs="?", default=SOURCE, help="Lexicon table")
+    parser.add_argument("--output", default=LEXICON_PATH, help="Data file to write")
+    args = parser.parse_args()
+
+    rows = read_rows(args.source)
+    index = EmojiIndex.build(process_and_flatten_array(rows))
+    data = {
+        "version": LEXICON_VERSION,
+        "emojis": rows,
+        "keywords": index.keywords,
+        "phrases": index.phrases,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    size = os.path.getsize(args.output)
+    print(f"Wrote {len(rows)} emojis to {args.output} ({size / 1e3:.0f} kB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Build the packed emoji archive from a directory of numbered PNGs, or unpack it.
+
+    python scripts/pack_emojis.py emojis/ [--output shortcap/assets/emojis.pack]
+        [--raw]
+    python scripts/pack_emojis.py --unpack emojis/
+        [--pack shortcap/assets/emojis.pack]
+
+Each `<id>.png` (the id is the first column of scripts/emoji_lexicon.tsv) is
+decoded to RGBA and stored under its id. Payloads are zlib compressed
+unless --raw is given, which trades a larger file for lookups that are
+arrays over the memory map itself. --unpack writes every emoji of a pack
+back to `<id>.png`, losslessly, so the images can be edited and packed
+again.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from shortcap.emoji_pack import PACK_PATH, EmojiPack, write_emoji_pack  # noqa: E402
+
+
+def read_emojis(directory):
+    for name in sorted(os.listdir(directory)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() != ".png" or not stem.isdigit():
+            continue
+        with Image.open(os.path.join(directory, name)) as image:
+            yield int(stem), numpy.array(image.convert("RGBA"))
+
+
+def write_emojis(pack, directory):
+    os.makedirs(directory, exist_ok=True)
+    for emoji_id in pack:
+        path = os.path.join(directory, f"{emoji_id}.png")
+        Image.fromarray(pack.rgba(emoji_id), "RGBA").save(path)
+    return len(pack)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack emoji PNGs into one archive")
+    parser.add_argument(
+        "directory", nargs="?", help="Directory of <id>.png emoji images"
+    )
+    parser.add_argument("--output", default=PACK_PATH, help="Pack file to write")
+    parser.add_argument(
+        "--raw", action="store_true", help="Store uncompressed RGBA payloads"
+    )
+    parser.add_argument(
+        "--unpack", metavar="DIRECTORY", help="Write the emojis of a pack as PNGs"
+    )
+    parser.add_argument("--pack", default=PACK_PATH, help="Pack file to unpack")
+    args = parser.parse_args()
+
+    if args.unpack:
+        count = write_emojis(EmojiPack(args.pack), args.unpack)
+        print(f"Unpacked {count} emojis into {args.unpack}")
+        return
+    if not args.directory:
+        parser.error("a directory to pack, or --unpack, is required")
+
+    count = write_emoji_pack(
+        read_emojis(args.directory), args.output, compress=not args.raw
+    )
+    size = os.path.getsize(args.output)
+    print(f"Packed {count} emojis into {args.output} ({size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
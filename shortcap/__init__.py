@@ -1,5 +1,6 @@
 import logging
 from .add_captions import add_captions
+from .cache import cache_stats, clear_caches
 from importlib.metadata import version
 
 
@@ -40,4 +41,4 @@ def configure_logging(log_file=None):
 
 
 __version__ = version("shortcap")
-__all__ = ["add_captions", "configure_logging"]
+__all__ = ["add_captions", "cache_stats", "clear_caches", "configure_logging"]
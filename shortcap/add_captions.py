@@ -1,26 +1,24 @@
 from typing import Optional, Callable, List, Dict, Any, Union
-from moviepy.editor import VideoFileClip, CompositeVideoClip
-import subprocess
+from moviepy.editor import VideoClip, VideoFileClip
 import tempfile
 import time
 import os
 import logging
-import pkg_resources
 
 from . import emojis
 from . import segment_parser
 from . import transcriber
 from . import utils
-from .text_renderer import (
-    create_text_ex,
-    Word,
-)
+from .ass_renderer import render_ass
+from .caption_layer import CaptionLayer, create_caption_sprites
+from .overlay_renderer import render_overlay
+from .parallel_renderer import render_parallel
+from .smart_renderer import render_smart
+from .stream_renderer import render_stream
 from .utils import (
     ffmpeg,
     get_font_path,
     fits_frame,
-    calculate_lines,
-    create_shadow,
 )
 from .config import (
     DEFAULT_FONT,
@@ -35,10 +33,18 @@ from .config import (
     DEFAULT_SHADOW_STRENGTH,
     DEFAULT_SHADOW_BLUR,
     DEFAULT_POSITION,
-    DEFAULT_PADDING_EMOJI,
+    DEFAULT_RENDERER,
+    DEFAULT_ENCODING_PROFILE,
+    DEFAULT_EMOJI_MATCHER,
+    ENCODING_PROFILES,
 )
 
-lines_cache = {}
+# "moviepy" blends caption sprites frame by frame, "ass" burns an ASS script with
+# ffmpeg, "overlay" has ffmpeg composite the same sprites as PNGs, "stream"
+# blends them into raw frames piped between two ffmpeg processes, "parallel"
+# streams chunks of the video in worker processes and "smart" re-encodes only
+# the GOPs that show captions, stream-copying the others
+RENDERERS = ("moviepy", "ass", "overlay", "stream", "parallel", "smart")
 
 logger = logging.getLogger("shortcap.add_captions")
 
@@ -69,31 +75,49 @@ def add_captions(
     segments: Optional[List[Dict[str, Any]]] = None,
     align_words: bool = True,
     language: Optional[str] = None,
-) -> CompositeVideoClip:
+    renderer: str = DEFAULT_RENDERER,
+    workers: Optional[int] = None,
+    profile: str = DEFAULT_ENCODING_PROFILE,
+    emoji_matcher: str = DEFAULT_EMOJI_MATCHER,
+) -> Optional[VideoClip]:
     try:
+        if renderer not in RENDERERS:
+            raise CaptionError(f"Invalid renderer: {renderer}")
+        if profile not in ENCODING_PROFILES:
+            raise CaptionError(f"Invalid encoding profile: {profile}")
+        if emoji_matcher not in emojis.EMOJI_MATCHERS:
+            raise CaptionError(f"Invalid emoji matcher: {emoji_matcher}")
+
         _start_time = time.time()
 
-        # 修改字体处理逻辑
-        if font == DEFAULT_FONT:
-            font = pkg_resources.resource_filename(
-                "shortcap", "assets/fonts/SF-Pro.ttf"
-            )
-        else:
+        # 修改字体处理逻辑: bundled fonts are found by name, like the default
+        try:
             font = get_font_path(font)
+        except FileNotFoundError as e:
+            raise CaptionError(str(e))
 
-        if not os.path.exists(font) and font not in ["Arial", "Helvetica"]:
-            raise CaptionError(f"Font not found: {font}")
-
-        if print_info:
-            logger.info("Extracting audio...")
-
-        temp_audio_file = tempfile.NamedTemporaryFile(suffix=".wav").name
+        # One probe gives the stream layout every renderer needs
         try:
-            ffmpeg(["ffmpeg", "-y", "-i", video_file, temp_audio_file])
-        except subprocess.CalledProcessError as e:
-            raise CaptionError(f"Failed to extract audio: {str(e)}")
+            info = utils.probe_video(video_file)
+        except Exception as e:
+            raise CaptionError(f"Failed to probe video file: {str(e)}")
+
+        video_width, video_height = info["size"]
 
         if segments is None:
+            if not info["has_audio"]:
+                raise CaptionError("Video has no audio stream to transcribe")
+
+            if print_info:
+                logger.info("Extracting audio...")
+
+            # The WAV is only decoded for transcription
+            temp_audio_file = tempfile.NamedTemporaryFile(suffix=".wav").name
+            try:
+                ffmpeg(["ffmpeg", "-y", "-i", video_file, temp_audio_file])
+            except Exception as e:
+                raise CaptionError(f"Failed to extract audio: {str(e)}")
+
             if print_info:
                 logger.info("Transcribing audio...")
             try:
@@ -106,13 +130,7 @@ def add_captions(
         if print_info:
             logger.info("Generating video elements...")
 
-        try:
-            video = VideoFileClip(video_file)
-        except Exception as e:
-            raise CaptionError(f"Failed to open video file: {str(e)}")
-
-        text_bbox_width = video.w - padding * 2
-        clips = [video]
+        text_bbox_width = video_width - padding * 2
 
         captions = segment_parser.parse(
             segments=segments,
@@ -127,143 +145,146 @@ def add_captions(
             ),
         )
 
-        captions = emojis.fetch_similar_emojis(captions, language)
+        captions = emojis.fetch_similar_emojis(captions, language, emoji_matcher)
 
         utils.check_captions(captions)
 
-        for caption in captions:
-            # Generate individual word-timed captions like ASS's \k tags
-            captions_to_draw = []
-            if highlight_current_word:
-                for i, word in enumerate(caption["words"]):
-                    start = word["start"]
-                    end = word[
-                        "end"
-                    ]  # Previously : caption["words"][i + 1]["start"] if i + 1 < len(caption["words"]) else
-                    captions_to_draw.append(
-                        {
-                            "text": word["word"].strip(),
-                            "start": start,
-                            "end": end,
-                            "index": i,
-                        }
-                    )
-            else:
-                captions_to_draw.append(
-                    {
-                        "text": caption["text"],
-                        "start": caption["start"],
-                        "end": caption["end"],
-                        "index": -1,
-                    }
-                )
+        style = {
+            "font_size": font_size,
+            "font_color": font_color,
+            "stroke_width": stroke_width,
+            "stroke_color": stroke_color,
+            "highlight_current_word": highlight_current_word,
+            "word_highlight_color": word_highlight_color,
+            "padding": padding,
+            "position": position,
+            "shadow_strength": shadow_strength,
+            "shadow_blur": shadow_blur,
+        }
+
+        if renderer == "ass":
+            generation_time = time.time() - _start_time
 
-            for current_index, word_caption in enumerate(captions_to_draw):
-                # Use text layout logic
-                line_data = calculate_lines(
-                    word_caption["text"], font, font_size, stroke_width, text_bbox_width
-                )
+            if print_info:
+                logger.info("Rendering video with ASS subtitles...")
 
-                # Vertical alignment
-                if isinstance(position, int):
-                    text_y_offset = position
-                elif position == "center":
-                    text_y_offset = video.h // 2 - line_data["height"] // 2
-                elif position == "top":
-                    text_y_offset = padding
-                elif position == "bottom":
-                    text_y_offset = video.h - line_data["height"] - padding
-                else:
-                    raise ValueError("Invalid vertical position.")
-
-                for i, line in enumerate(line_data["lines"]):
-                    pos = ("center", text_y_offset)
-
-                    ## Add emoji to caption above first line
-                    if i == 1 and caption["emoji"]:
-                        emoji_clip = (
-                            emojis.create_emoji_clip(caption["emoji"])
-                            .set_start(caption["start"])
-                            .set_duration(caption["end"] - caption["start"])
-                            .set_position(pos + DEFAULT_PADDING_EMOJI)
-                        )
-                        clips.append(emoji_clip)
-                        logger.info(f"Emoji added: {caption['emoji']}")
-
-                    word_objects = []
-                    for i, word in enumerate(line["text"].split()):
-                        word_obj = Word(word)
-                        if highlight_current_word and i == word_caption.get("index"):
-                            word_obj.set_color(word_highlight_color)
-                        word_objects.append(word_obj)
-
-                    # Shadow layers (fading if shadow_strength isn't an int)
-                    remaining_shadow = shadow_strength
-                    while remaining_shadow >= 1:
-                        shadow = (
-                            create_shadow(
-                                line["text"], font_size, font, shadow_blur, opacity=1
-                            )
-                            .set_start(word_caption["start"])
-                            .set_duration(word_caption["end"] - word_caption["start"])
-                            .set_position(pos)
-                        )
-                        clips.append(shadow)
-                        remaining_shadow -= 1
-
-                    if remaining_shadow > 0:
-                        shadow = (
-                            create_shadow(
-                                line["text"],
-                                font_size,
-                                font,
-                                shadow_blur,
-                                opacity=remaining_shadow,
-                            )
-                            .set_start(word_caption["start"])
-                            .set_duration(word_caption["end"] - word_caption["start"])
-                            .set_position(pos)
-                        )
-                        clips.append(shadow)
-
-                    # Text clip
-                    text = (
-                        create_text_ex(
-                            word_objects,
-                            font_size,
-                            font_color,
-                            font,
-                            stroke_color=stroke_color,
-                            stroke_width=stroke_width,
-                        )
-                        .set_start(word_caption["start"])
-                        .set_duration(word_caption["end"] - word_caption["start"])
-                        .set_position(pos)
-                    )
+            # libass draws and ffmpeg encodes; no frame goes through Python
+            try:
+                render_ass(
+                    video_file,
+                    output_file,
+                    captions,
+                    video_width,
+                    video_height,
+                    font,
+                    profile,
+                    **style,
+                )
+            except Exception as e:
+                raise CaptionError(f"Failed to write output video: {str(e)}")
 
-                    clips.append(text)
-                    text_y_offset += line["height"]
+            video_with_text = None
+        else:
+            sprites = create_caption_sprites(captions, info["size"], font, **style)
 
-        end_time = time.time()
-        generation_time = end_time - _start_time
+            end_time = time.time()
+            generation_time = end_time - _start_time
 
-        if print_info:
-            logger.info(
-                f"Generated in {generation_time // 60:02.0f}:{generation_time % 60:02.0f} ({len(clips)} clips)"
-            )
-            logger.info("Rendering video...")
+            if print_info:
+                logger.info(
+                    f"Generated in {generation_time // 60:02.0f}:{generation_time % 60:02.0f} ({len(sprites)} sprites)"
+                )
+                logger.info("Rendering video...")
+
+            if renderer == "overlay":
+                # Compositing and encoding both run in ffmpeg's threads
+                try:
+                    render_overlay(video_file, output_file, sprites, profile)
+                except Exception as e:
+                    raise CaptionError(f"Failed to write output video: {str(e)}")
+
+                video_with_text = None
+            elif renderer == "stream":
+                # Constant memory: one frame buffer, reused for the whole video
+                try:
+                    render_stream(
+                        video_file,
+                        output_file,
+                        sprites,
+                        info["size"],
+                        info["fps"],
+                        profile=profile,
+                    )
+                except Exception as e:
+                    raise CaptionError(f"Failed to write output video: {str(e)}")
+
+                video_with_text = None
+            elif renderer == "parallel":
+                # One chunk per worker process, defaulting to every CPU core
+                try:
+                    chunks = render_parallel(
+                        video_file,
+                        output_file,
+                        sprites,
+                        info["size"],
+                        info["fps"],
+                        info["duration"],
+                        workers,
+                        profile,
+                    )
+                except Exception as e:
+                    raise CaptionError(f"Failed to write output video: {str(e)}")
+
+                if print_info:
+                    logger.info(f"Rendered in {chunks} parallel chunks")
+
+                video_with_text = None
+            elif renderer == "smart":
+                try:
+                    encoded, copied = render_smart(
+                        video_file,
+                        output_file,
+                        sprites,
+                        info["size"],
+                        info["fps"],
+                        info["duration"],
+                        info["video_stream"],
+                        profile,
+                    )
+                except Exception as e:
+                    raise CaptionError(f"Failed to write output video: {str(e)}")
 
-        video_with_text = CompositeVideoClip(clips)
+                if print_info:
+                    logger.info(
+                        f"Re-encoded {encoded} frames, stream-copied {copied} frames"
+                    )
 
-        try:
-            video_with_text.write_videofile(
-                filename=output_file,
-                codec="libx264",
-                fps=video.fps,
-                logger="bar" if print_info else None,
-            )
-        except Exception as e:
-            raise CaptionError(f"Failed to write output video: {str(e)}")
+                video_with_text = None
+            else:
+                try:
+                    video = VideoFileClip(video_file, audio=False)
+                except Exception as e:
+                    raise CaptionError(f"Failed to open video file: {str(e)}")
+
+                # One caption layer instead of a CompositeVideoClip walking every clip per frame
+                video_with_text = CaptionLayer(sprites).apply(video)
+
+                # MoviePy only encodes the video; the source audio is copied in as is
+                temp_video_file = tempfile.NamedTemporaryFile(suffix=".mp4").name
+                encoding = ENCODING_PROFILES[profile]
+                try:
+                    video_with_text.write_videofile(
+                        filename=temp_video_file,
+                        codec=encoding["codec"],
+                        preset=str(encoding.get("preset", "medium")),
+                        ffmpeg_params=utils.encoder_params(profile),
+                        fps=video.fps,
+                        audio=False,
+                        logger="bar" if print_info else None,
+                    )
+                    utils.mux_audio(temp_video_file, video_file, output_file)
+                except Exception as e:
+                    raise CaptionError(f"Failed to write output video: {str(e)}")
 
         end_time = time.time()
         total_time = end_time - _start_time
@@ -276,6 +297,11 @@ def add_captions(
             logger.info(
                 f"Rendered in {render_time // 60:02.0f}:{render_time % 60:02.0f}"
             )
+            if render_time > 0:
+                logger.info(
+                    f"Throughput ({renderer}): {info['duration'] * info['fps'] / render_time:.1f} fps, "
+                    f"{info['duration'] / render_time:.2f}x realtime"
+                )
             logger.info(f"Done in {total_time // 60:02.0f}:{total_time % 60:02.0f}")
 
         return video_with_text
@@ -293,3 +319,8 @@ def add_captions(
                 os.remove(temp_audio_file)
             except Exception as e:
                 logger.warning(f"Failed to remove temporary audio file: {str(e)}")
+        if "temp_video_file" in locals() and os.path.exists(temp_video_file):
+            try:
+                os.remove(temp_video_file)
+            except Exception as e:
+                logger.warning(f"Failed to remove temporary video file: {str(e)}")
@@ -0,0 +1,234 @@
+from PIL import ImageColor
+from typing import Any, Dict, List, Tuple, Union
+import logging
+import os
+import struct
+import subprocess
+import tempfile
+
+from .config import DEFAULT_ENCODING_PROFILE
+from .fonts import load_font
+from .utils import encoder_args, ffmpeg, filter_escape, layout_caption
+
+logger = logging.getLogger("shortcap.ass_renderer")
+
+
+class AssRenderError(Exception):
+    """Custom exception class for handling errors during ASS rendering"""
+
+    pass
+
+
+def ass_color(color: str, alpha: int = 0) -> str:
+    """Convert a color name or hex code to ASS's &HAABBGGRR notation."""
+    r, g, b = ImageColor.getrgb(color)[:3]
+    return f"&H{alpha:02X}{b:02X}{g:02X}{r:02X}&"
+
+
+def ass_timestamp(seconds: float) -> str:
+    centiseconds = max(int(round(seconds * 100)), 0)
+    hours, centiseconds = divmod(centiseconds, 360000)
+    minutes, centiseconds = divmod(centiseconds, 6000)
+    seconds, centiseconds = divmod(centiseconds, 100)
+    return f"{hours}:{minutes:02d}:{seconds:02d}.{centiseconds:02d}"
+
+
+def ass_escape(text: str) -> str:
+    # Braces open override blocks and backslashes start tags
+    return text.replace("\\", "/").replace("{", "(").replace("}", ")")
+
+
+def win_metrics(font: str) -> Tuple[int, int, int]:
+    """Read unitsPerEm, usWinAscent and usWinDescent from a TrueType/OpenType file.
+
+    Falls back to Pillow's ascent and descent (at 1000 units per em) when the
+    file isn't a plain sfnt, e.g. a font collection.
+    """
+    try:
+        with open(font, "rb") as f:
+            data = f.read()
+        (num_tables,) = struct.unpack(">H", data[4:6])
+        offsets = {}
+        for i in range(num_tables):
+            record = 12 + 16 * i
+            offsets[data[record : record + 4]] = struct.unpack(
+                ">I", data[record + 8 : record + 12]
+            )[0]
+        head, os2 = offsets[b"head"], offsets[b"OS/2"]
+        (units_per_em,) = struct.unpack(">H", data[head + 18 : head + 20])
+        win_ascent, win_descent = struct.unpack(">HH", data[os2 + 74 : os2 + 78])
+        if units_per_em and win_ascent + win_descent:
+            return units_per_em, win_ascent, win_descent
+    except (OSError, KeyError, struct.error) as e:
+        logger.debug(f"No OS/2 metrics in {font}: {str(e)}")
+
+    ascent, descent = load_font(font, 1000).getmetrics()
+    return 1000, ascent, descent
+
+
+def build_ass(
+    captions: List[Dict[str, Any]],
+    video_width: int,
+    video_height: int,
+    font: str,
+    font_size: int,
+    font_color: str,
+    stroke_width: int,
+    stroke_color: str,
+    highlight_current_word: bool,
+    word_highlight_color: str,
+    padding: int,
+    position: Union[int, str],
+    shadow_strength: float,
+    shadow_blur: float,
+) -> str:
+    """Write captions as an ASS script that libass renders like the MoviePy path.
+
+    Lines are broken and placed with the same layout as the sprites. Each
+    highlight state of a line is one Dialogue event with the highlighted
+    word recolored, and the shadow is one blurred event per unit of
+    `shadow_strength` on a lower layer. Emojis are images, which ASS can't draw, so they are left out.
+    """
+    pil_font = load_font(font, font_size)
+
+    # libass matches the full name ("Source Sans 3 Black"), not the typographic family
+    family, style_name = pil_font.getname()
+    if style_name and style_name != "Regular":
+        family = f"{family} {style_name}"
+    text_bbox_width = video_width - padding * 2
+
+    # libass sizes fonts by their Windows line height, Pillow by em size; the
+    # text is anchored at the top of that line, so move it to Pillow's baseline
+    units_per_em, win_ascent, win_descent = win_metrics(font)
+    ass_font_size = font_size * (win_ascent + win_descent) / units_per_em
+    baseline_offset = pil_font.getmetrics()[0] - round(
+        font_size * win_ascent / units_per_em
+    )
+
+    # Same geometry as text_renderer.render_shadow: centered, pushed down by the blur padding
+    blur_radius = int(font_size * shadow_blur)
+    shadow_dx = int(blur_radius * 0.6) - blur_radius // 2
+    shadow_dy = blur_radius + int(blur_radius * 0.6)
+
+    # One shadow event per unit of strength, like the stacked shadow layers
+    # of caption_layer; the last one fades if the strength isn't an int
+    shadow_alphas = []
+    remaining_shadow = shadow_strength
+    while remaining_shadow > 0:
+        shadow_alphas.append(int(round(255 * (1 - min(remaining_shadow, 1)))))
+        remaining_shadow -= 1
+
+    header = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {video_width}",
+        f"PlayResY: {video_height}",
+        "WrapStyle: 2",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
+        "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, "
+        "ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, "
+        "MarginR, MarginV, Encoding",
+        f"Style: Default,{family},{ass_font_size:g},{ass_color(font_color)},"
+        f"{ass_color(word_highlight_color)},{ass_color(stroke_color or 'black')},"
+        f"{ass_color('black')},0,0,0,0,100,100,0,0,1,{stroke_width},0,8,"
+        f"{padding},{padding},0,1",
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+    ]
+
+    events = []
+    center_x = video_width // 2
+    for caption in captions:
+        layout = layout_caption(
+            caption,
+            font,
+            font_size,
+            stroke_width,
+            text_bbox_width,
+            video_height,
+            position,
+            padding,
+            highlight_current_word,
+        )
+
+        for line in layout["lines"]:
+            # The Pillow canvas reserves the stroke above the ascender
+            y = line["y"] + stroke_width + baseline_offset
+            words = [ass_escape(word) for word in line["words"]]
+
+            for shadow_alpha in shadow_alphas:
+                events.append(
+                    f"Dialogue: 0,{ass_timestamp(caption['start'])},"
+                    f"{ass_timestamp(caption['end'])},Default,,0,0,0,,"
+                    f"{{\\an8\\pos({center_x + shadow_dx},{y + shadow_dy})"
+                    f"\\bord0\\shad0\\blur{blur_radius}\\1c{ass_color('black')}"
+                    f"\\1a&H{shadow_alpha:02X}&}}{' '.join(words)}"
+                )
+
+            for state in line["states"]:
+                text = " ".join(
+                    f"{{\\1c{ass_color(word_highlight_color)}}}{word}"
+                    f"{{\\1c{ass_color(font_color)}}}"
+                    if i == state["index"]
+                    else word
+                    for i, word in enumerate(words)
+                )
+                events.append(
+                    f"Dialogue: 1,{ass_timestamp(state['start'])},"
+                    f"{ass_timestamp(state['end'])},Default,,0,0,0,,"
+                    f"{{\\an8\\pos({center_x},{y})}}{text}"
+                )
+
+    return "\n".join(header + events) + "\n"
+
+
+def burn_ass(
+    video_file: str,
+    subtitles_file: str,
+    output_file: str,
+    fonts_dir: str,
+    profile: str = DEFAULT_ENCODING_PROFILE,
+) -> subprocess.CompletedProcess:
+    """Burn an ASS script into a video in one ffmpeg pass, copying the audio."""
+    subtitles_filter = (
+        f"ass={filter_escape(subtitles_file)}:fontsdir={filter_escape(fonts_dir)}"
+    )
+    return ffmpeg(
+        ["ffmpeg", "-y", "-i", video_file, "-vf", subtitles_filter]
+        + encoder_args(profile)
+        + ["-c:a", "copy", output_file]
+    )
+
+
+def render_ass(
+    video_file: str,
+    output_file: str,
+    captions: List[Dict[str, Any]],
+    video_width: int,
+    video_height: int,
+    font: str,
+    profile: str = DEFAULT_ENCODING_PROFILE,
+    **style: Any,
+) -> None:
+    subtitles_file = tempfile.NamedTemporaryFile(suffix=".ass", delete=False).name
+    try:
+        script = build_ass(captions, video_width, video_height, font, **style)
+        with open(subtitles_file, "w", encoding="utf-8") as f:
+            f.write(script)
+
+        burn_ass(
+            video_file,
+            subtitles_file,
+            output_file,
+            os.path.dirname(os.path.abspath(font)),
+            profile,
+        )
+    except Exception as e:
+        logger.error(f"Failed to render ASS subtitles: {str(e)}")
+        raise AssRenderError(f"Failed to render ASS subtitles: {str(e)}")
+    finally:
+        os.remove(subtitles_file)
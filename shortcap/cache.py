@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+import logging
+import sys
+import threading
+
+logger = logging.getLogger("shortcap.cache")
+
+caches: Dict[str, "SpriteCache"] = {}
+
+_kwargs_marker = object()
+
+
+def sizeof(value: Any) -> int:
+    """Approximate memory held by a cached value, in bytes."""
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    # MoviePy clips: ImageClip pixels, masks and composite children
+    size = sys.getsizeof(value)
+    img = getattr(value, "img", None)
+    if img is not None:
+        size += sizeof(img)
+    mask = getattr(value, "mask", None)
+    if mask is not None:
+        size += sizeof(mask)
+    for clip in getattr(value, "clips", None) or []:
+        size += sizeof(clip)
+
+    # Glyph atlases
+    texture = getattr(value, "texture", None)
+    if texture is not None:
+        size += sizeof(texture)
+
+    return size
+
+
+class SpriteCache:
+    """Thread-safe LRU cache bounded by the memory its values hold.
+
+    Keys are compared by equality, never by hash alone, so different
+    arguments can't collide. Every cache registers itself by name so
+    `clear_caches` and `cache_stats` can reach all of them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        sizeof: Callable[[Any], int] = sizeof,
+    ):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.sizes: Dict[Hashable, int] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+        caches[name] = self
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = self.sizeof(value)
+        with self.lock:
+            if key in self.entries:
+                self.bytes -= self.sizes.pop(key)
+                del self.entries[key]
+
+            if size > self.max_bytes:
+                logger.debug(f"{self.name} cache: {size} byte entry exceeds budget")
+                return
+
+            self.entries[key] = value
+            self.sizes[key] = size
+            self.bytes += size
+
+            while self.bytes > self.max_bytes:
+                evicted, _ = self.entries.popitem(last=False)
+                self.bytes -= self.sizes.pop(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def cached(cache: SpriteCache) -> Callable[[Callable], Callable]:
+    """Memoize a function in a SpriteCache, like functools.lru_cache."""
+
+    def decorator(function: Callable) -> Callable:
+        missing = object()
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_kwargs_marker,) + tuple(sorted(kwargs.items()))
+
+            value = cache.get(key, missing)
+            if value is missing:
+                value = function(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def clear_caches(name: Optional[str] = None) -> None:
+    """Drop cached sprites, layouts and glyphs, e.g. between jobs."""
+    for cache in caches.values():
+        if name is None or cache.name == name:
+            cache.clear()
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    return {name: cache.stats() for name, cache in caches.items()}
@@ -0,0 +1,321 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from moviepy.editor import VideoClip
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+import logging
+import numpy
+
+from . import emojis
+from .config import DEFAULT_PADDING_EMOJI, EMOJI_SCALE
+from .text_renderer import LineRaster, render_shadow
+from .utils import layout_caption
+
+logger = logging.getLogger("shortcap.caption_layer")
+
+# Pre-blended overlays kept per layer; frames mostly arrive in order, so
+# only the intervals around the current one are ever reused
+OVERLAY_CACHE_SIZE = 8
+
+
+class Sprite(NamedTuple):
+    image: numpy.ndarray  # RGBA, uint8
+    x: int
+    y: int
+    start: float
+    end: float
+    # The image already premultiplied and cropped, at (left, top) in it
+    premultiplied: Optional[Tuple[numpy.ndarray, int, int]] = None
+
+
+class Overlay(NamedTuple):
+    # Fixed point with 8 fractional bits: premultiplied color * 256 + 0.5 and
+    # (255 - alpha) / 255 * 256, so blending is a multiply, an add and a shift
+    rgb: numpy.ndarray  # (height, width, 3), uint16
+    inverse_alpha: numpy.ndarray  # (height, width, 1), uint16
+    x: int
+    y: int
+
+
+def div255(values: numpy.ndarray, scratch: numpy.ndarray) -> numpy.ndarray:
+    """Round uint16 `values` / 255 in place, exactly, with shifts instead of a division."""
+    numpy.add(values, 128, out=values)
+    numpy.right_shift(values, 8, out=scratch)
+    numpy.add(values, scratch, out=values)
+    numpy.right_shift(values, 8, out=values)
+    return values
+
+
+def premultiply(sprite: Sprite) -> Optional[Sprite]:
+    """Crop a sprite to its visible pixels and premultiply its color by alpha."""
+    if sprite.premultiplied is not None:
+        image, left, top = sprite.premultiplied
+        if not image.size:
+            return None
+        return sprite._replace(image=image, x=sprite.x + left, y=sprite.y + top)
+
+    alpha = sprite.image[..., 3]
+    rows = numpy.flatnonzero(alpha.any(axis=1))
+    cols = numpy.flatnonzero(alpha.any(axis=0))
+    if not len(rows):
+        return None
+
+    top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    image = sprite.image[top:bottom, left:right].astype(numpy.uint16)
+    image[..., :3] *= image[..., 3:]
+    div255(image[..., :3], numpy.empty_like(image[..., :3]))
+    return sprite._replace(
+        image=image.astype(numpy.uint8),
+        x=sprite.x + int(left),
+        y=sprite.y + int(top),
+    )
+
+
+class CaptionLayer:
+    """Every caption sprite of a video, indexed by time.
+
+    The timeline is cut at each sprite start and end; between two of these
+    change points the set of visible sprites is constant and precomputed,
+    so finding what to draw at time t is one bisect. The visible sprites of
+    an interval are blended together once, in the order they were given
+    (like clips in a CompositeVideoClip), into an overlay cropped to their
+    bounding box; each frame then takes a single blend of that region.
+
+    Sprites are kept premultiplied and cropped to their visible pixels, and
+    blending is integer math into preallocated buffers, so drawing a frame
+    allocates nothing.
+    """
+
+    def __init__(self, sprites: Sequence[Sprite]):
+        self.sprites = list(sprites)
+        self.premultiplied = [premultiply(sprite) for sprite in self.sprites]
+        self.change_points, self.active = self._index(self.sprites)
+        self.overlays: "OrderedDict[Tuple[int, Tuple[int, int]], Optional[Overlay]]"
+        self.overlays = OrderedDict()
+
+        # Blending buffer, grown to the largest overlay
+        self.products = numpy.empty((0, 0, 3), dtype=numpy.uint16)
+        self.frame: Optional[numpy.ndarray] = None
+
+    @staticmethod
+    def _index(sprites: List[Sprite]) -> Tuple[List[float], List[Tuple[int, ...]]]:
+        events = sorted(
+            [(sprite.start, i) for i, sprite in enumerate(sprites)]
+            + [(sprite.end, i) for i, sprite in enumerate(sprites)]
+        )
+        change_points = sorted({time for time, _ in events})
+
+        # Sweep the change points, toggling sprites as their start or end is passed
+        active = []
+        playing = set()
+        event = 0
+        for time in change_points:
+            while event < len(events) and events[event][0] == time:
+                _, i = events[event]
+                if sprites[i].start == time and sprites[i].end > time:
+                    playing.add(i)
+                else:
+                    playing.discard(i)
+                event += 1
+            active.append(tuple(sorted(playing)))
+
+        return change_points, active
+
+    def active_sprites(self, t: float) -> Tuple[int, ...]:
+        """Indices of the sprites visible at time t (start <= t < end)."""
+        interval = bisect_right(self.change_points, t) - 1
+        if interval < 0:
+            return ()
+        return self.active[interval]
+
+    def overlay(self, interval: int, frame_size: Tuple[int, int]) -> Optional[Overlay]:
+        """The sprites of an interval blended together, clipped to the frame."""
+        key = (interval, frame_size)
+        if key in self.overlays:
+            self.overlays.move_to_end(key)
+            return self.overlays[key]
+
+        height, width = frame_size
+        visible = []
+        for i in self.active[interval]:
+            sprite = self.premultiplied[i]
+            if sprite is None:
+                continue
+            left, top = max(sprite.x, 0), max(sprite.y, 0)
+            right = min(sprite.x + sprite.image.shape[1], width)
+            bottom = min(sprite.y + sprite.image.shape[0], height)
+            if right > left and bottom > top:
+                visible.append((sprite, left, top, right, bottom))
+
+        overlay = None
+        if visible:
+            x = min(left for _, left, _, _, _ in visible)
+            y = min(top for _, _, top, _, _ in visible)
+            right = max(right for _, _, _, right, _ in visible)
+            bottom = max(bottom for _, _, _, _, bottom in visible)
+            image = numpy.zeros((bottom - y, right - x, 4), dtype=numpy.uint16)
+
+            # Premultiplied "over": dst = src + dst * (255 - src_alpha) / 255
+            for sprite, left, top, right, bottom in visible:
+                src = sprite.image[
+                    top - sprite.y : bottom - sprite.y,
+                    left - sprite.x : right - sprite.x,
+                ]
+                dst = image[top - y : bottom - y, left - x : right - x]
+                dst *= 255 - src[..., 3:].astype(numpy.uint16)
+                div255(dst, numpy.empty_like(dst))
+                dst += src
+
+            # Floored so a frame pixel never overflows 16 bits: with color <= alpha,
+            # 255 * inverse_alpha + rgb <= 255 * 256 + 128
+            overlay = Overlay(
+                (image[..., :3] << 8) + 128,
+                ((255 - image[..., 3:]) << 8) // 255,
+                x,
+                y,
+            )
+
+        self.overlays[key] = overlay
+        if len(self.overlays) > OVERLAY_CACHE_SIZE:
+            self.overlays.popitem(last=False)
+        return overlay
+
+    def blend(self, frame: numpy.ndarray, t: float) -> numpy.ndarray:
+        """Alpha-blend the sprites visible at time t onto an RGB frame, in place."""
+        interval = bisect_right(self.change_points, t) - 1
+        if interval < 0 or not self.active[interval]:
+            return frame
+
+        overlay = self.overlay(interval, frame.shape[:2])
+        if overlay is None:
+            return frame
+
+        height, width = overlay.rgb.shape[:2]
+        if height > self.products.shape[0] or width > self.products.shape[1]:
+            self.products = numpy.empty(
+                (
+                    max(height, self.products.shape[0]),
+                    max(width, self.products.shape[1]),
+                    3,
+                ),
+                dtype=numpy.uint16,
+            )
+
+        # region = (region * inverse_alpha + rgb) >> 8, in one preallocated buffer
+        region = frame[overlay.y : overlay.y + height, overlay.x : overlay.x + width]
+        products = self.products[:height, :width]
+        numpy.multiply(region, overlay.inverse_alpha, out=products, dtype=numpy.uint16)
+        numpy.add(products, overlay.rgb, out=products)
+        numpy.right_shift(products, 8, out=products)
+        numpy.copyto(region, products, casting="unsafe")
+        return frame
+
+    def apply(self, video: VideoClip) -> VideoClip:
+        """Return `video` with the captions blended into every frame.
+
+        Frames are drawn into one buffer that is reused for the next frame,
+        which suits writing the clip out; copy a frame to keep it.
+        """
+
+        def draw(get_frame, t):
+            source = get_frame(t)
+            if self.frame is None or self.frame.shape != source.shape:
+                self.frame = numpy.empty_like(source)
+            numpy.copyto(self.frame, source)
+            return self.blend(self.frame, t)
+
+        return video.fl(draw)
+
+
+def create_caption_sprites(
+    captions: List[Dict[str, Any]],
+    video_size: Tuple[int, int],
+    font: str,
+    font_size: int,
+    font_color: str,
+    stroke_width: int,
+    stroke_color: str,
+    highlight_current_word: bool,
+    word_highlight_color: str,
+    padding: int,
+    position: Union[int, str],
+    shadow_strength: float,
+    shadow_blur: float,
+) -> List[Sprite]:
+    """Render the emoji, shadow and text sprites of every caption."""
+    video_width, video_height = video_size
+    text_bbox_width = video_width - padding * 2
+    sprites = []
+
+    emoji_size = max(round(font_size * EMOJI_SCALE), 1)
+
+    for caption in captions:
+        layout = layout_caption(
+            caption,
+            font,
+            font_size,
+            stroke_width,
+            text_bbox_width,
+            video_height,
+            position,
+            padding,
+            highlight_current_word,
+        )
+
+        ## Add emoji to caption above first line
+        if caption["emoji"]:
+            # Shared with every caption showing the same emoji at this size
+            emoji = emojis.get_emoji(caption["emoji"], emoji_size)
+            sprites.append(
+                Sprite(
+                    emoji.image,
+                    (video_width - emoji.image.shape[1]) // 2,
+                    layout["y"] - emoji.image.shape[0] - DEFAULT_PADDING_EMOJI,
+                    caption["start"],
+                    caption["end"],
+                    (emoji.premultiplied, emoji.left, emoji.top),
+                )
+            )
+            logger.info(f"Emoji added: {caption['emoji']}")
+
+        for line in layout["lines"]:
+            # Rasterize the line once; highlight states only recolor it
+            line_raster = LineRaster(
+                line["words"], font_size, font, stroke_width, stroke_color
+            )
+
+            # Shadow layers (fading if shadow_strength isn't an int). They
+            # don't depend on the highlighted word, so they span the caption.
+            remaining_shadow = shadow_strength
+            while remaining_shadow > 0:
+                shadow = render_shadow(
+                    line_raster.fill_mask,
+                    int(font_size * shadow_blur),
+                    opacity=min(remaining_shadow, 1),
+                )
+                sprites.append(
+                    Sprite(
+                        shadow,
+                        (video_width - shadow.shape[1]) // 2,
+                        line["y"],
+                        caption["start"],
+                        caption["end"],
+                    )
+                )
+                remaining_shadow -= 1
+
+            for state in line["states"]:
+                # Text sprite
+                text = line_raster.render(
+                    font_color, state["index"], word_highlight_color
+                )
+                sprites.append(
+                    Sprite(
+                        text,
+                        (video_width - text.shape[1]) // 2,
+                        line["y"],
+                        state["start"],
+                        state["end"],
+                    )
+                )
+
+    return sprites
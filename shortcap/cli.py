@@ -9,7 +9,8 @@ import time
 # Add the parent directory of 'shortcap' to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from shortcap.add_captions import add_captions
+from shortcap.add_captions import add_captions, RENDERERS
+from shortcap.emojis import EMOJI_MATCHERS
 from shortcap.config import (
     DEFAULT_FONT,
     DEFAULT_FONT_SIZE,
@@ -23,6 +24,10 @@ from shortcap.config import (
     DEFAULT_SHADOW_STRENGTH,
     DEFAULT_SHADOW_BLUR,
     DEFAULT_POSITION,
+    DEFAULT_RENDERER,
+    DEFAULT_ENCODING_PROFILE,
+    DEFAULT_EMOJI_MATCHER,
+    ENCODING_PROFILES,
 )
 
 logger = logging.getLogger("shortcap.cli")
@@ -77,6 +82,29 @@ def main():
     parser.add_argument(
         "--shadow-blur", type=float, default=DEFAULT_SHADOW_BLUR, help="Shadow blur"
     )
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERERS,
+        default=DEFAULT_RENDERER,
+        help="Render engine",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=list(ENCODING_PROFILES),
+        default=DEFAULT_ENCODING_PROFILE,
+        help="Encoding profile (codec, preset and CRF)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for the parallel renderer (default: CPU count)",
+    )
+    parser.add_argument(
+        "--emoji-matcher",
+        choices=EMOJI_MATCHERS,
+        default=DEFAULT_EMOJI_MATCHER,
+        help="Emoji matching: exact keywords, or also similar words (vector)",
+    )
     parser.add_argument("--log-file", help="Path to log file")
     parser.add_argument("--language", type=str, help="Language of the file to subtitle")
     parser.add_argument(
@@ -122,6 +150,10 @@ def main():
             shadow_blur=args.shadow_blur,
             print_info=args.verbose,
             language=args.language,
+            renderer=args.renderer,
+            workers=args.workers,
+            profile=args.profile,
+            emoji_matcher=args.emoji_matcher,
         )
         logger.info(f"Captions added successfully. Output saved to {args.output_file}")
     except Exception as e:
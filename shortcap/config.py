@@ -3,6 +3,9 @@ DEFAULT_FONT = "SourceSans3-Black.ttf"
 DEFAULT_FONT_SIZE = 50
 DEFAULT_FONT_COLOR = "yellow"
 
+# default text rasterizer: "pillow" draws glyphs in-process, "imagemagick" uses MoviePy's TextClip
+DEFAULT_TEXT_BACKEND = "pillow"
+
 # default stroke config
 DEFAULT_STROKE_WIDTH = 3
 DEFAULT_STROKE_COLOR = "black"
@@ -15,6 +18,8 @@ DEFAULT_SHADOW_BLUR = 0.1
 DEFAULT_LINE_COUNT = 2
 DEFAULT_PADDING = 50
 DEFAULT_PADDING_EMOJI = 5
+# emoji height per font size unit: the 72 px assets at the default size
+EMOJI_SCALE = 1.44
 
 # default highlight config
 DEFAULT_HIGHLIGHT_CURRENT_WORD = True
@@ -23,11 +28,40 @@ DEFAULT_WORD_HIGHLIGHT_COLOR = "red"
 # default position config
 DEFAULT_POSITION = "center"
 
+# default render engine
+DEFAULT_RENDERER = "moviepy"
+
+# encoding profiles: ffmpeg video encoder settings, from fastest to smallest output
+ENCODING_PROFILES = {
+    "draft": {"codec": "libx264", "preset": "ultrafast", "crf": 28},
+    "social": {"codec": "libx264", "preset": "medium", "crf": 23},
+    "archive": {"codec": "libx265", "preset": "slow", "crf": 22},
+    "av1": {"codec": "libsvtav1", "preset": "8", "crf": 32},
+}
+DEFAULT_ENCODING_PROFILE = "social"
+
+# cache budgets in bytes (least recently used entries are evicted past them)
+TEXT_CACHE_BYTES = 256 * 1024 * 1024
+GLYPH_CACHE_BYTES = 64 * 1024 * 1024
+SHADOW_CACHE_BYTES = 256 * 1024 * 1024
+LAYOUT_CACHE_BYTES = 16 * 1024 * 1024
+EMOJI_CACHE_BYTES = 64 * 1024 * 1024
+ADVANCE_CACHE_BYTES = 4 * 1024 * 1024
+
 # whisperx config
 MODEL = "large-v3-turbo"
 DEVICE = "cpu"
 BATCH_SIZE = 16  # reduce if low on GPU mem
 COMPUTE_TYPE = "int8"  # change to "int8" if low on GPU mem (may reduce accuracy)
 
-# emojis store directory
-EMOJIS_DIR = "shortcap/assets/emojis/"
+# packed emoji images, relative to the package (built by scripts/pack_emojis.py)
+EMOJIS_PACK = "assets/emojis.pack"
+
+# emoji names, keywords and keyword index, relative to the package (built by scripts/build_emoji_lexicon.py)
+EMOJI_LEXICON = "assets/emoji_lexicon.json"
+
+# default emoji matcher: "keyword" matches keywords exactly, "vector" by character trigram similarity
+DEFAULT_EMOJI_MATCHER = "keyword"
+EMOJI_VECTOR_DIMENSIONS = 1024  # hashed trigram buckets, a power of two
+EMOJI_MATCH_THRESHOLD = 0.72  # cosine similarity a word needs to take the emoji
+EMOJI_MATCH_BATCH = 4096  # word and keyword pairs scored at once
@@ -0,0 +1,137 @@
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+import numpy
+
+from .config import EMOJIS_PACK
+
+logger = logging.getLogger("shortcap.emoji_pack")
+
+# Layout, little endian:
+#   header   magic, version, entry count
+#   index    one entry per emoji, sorted by id
+#   payloads RGBA rows, raw or zlib compressed
+MAGIC = b"SCEMOJI\0"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+ENTRY = struct.Struct("<IHHQIB3x")  # id, width, height, offset, length, codec
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+
+PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), EMOJIS_PACK)
+
+
+class EmojiPackError(Exception):
+    """Custom exception class for handling errors during emoji pack operations"""
+
+    pass
+
+
+class PackEntry(NamedTuple):
+    width: int
+    height: int
+    offset: int
+    length: int
+    codec: int
+
+
+class EmojiPack:
+    """Read-only view of a packed emoji archive, memory-mapped.
+
+    Only the index is parsed when the pack is opened; raw payloads are
+    returned as arrays over the mapping itself and compressed ones are
+    inflated straight from it, without reading the file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, "rb") as f:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.entries = self._read_index()
+        except (OSError, ValueError, struct.error) as e:
+            logger.error(f"Failed to open emoji pack {path}: {str(e)}")
+            raise EmojiPackError(f"Failed to open emoji pack {path}: {str(e)}")
+
+    def _read_index(self) -> Dict[int, PackEntry]:
+        magic, version, count = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not an emoji pack (version {VERSION})")
+
+        entries = {}
+        for i in range(count):
+            emoji_id, *entry = ENTRY.unpack_from(self.map, HEADER.size + i * ENTRY.size)
+            entries[emoji_id] = PackEntry(*entry)
+        return entries
+
+    def __contains__(self, emoji_id: object) -> bool:
+        try:
+            return int(emoji_id) in self.entries  # type: ignore[call-overload]
+        except (TypeError, ValueError):
+            return False
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.entries)
+
+    def rgba(self, emoji_id: object) -> numpy.ndarray:
+        """The RGBA pixels of an emoji, as a read-only (height, width, 4) array."""
+        try:
+            entry = self.entries[int(emoji_id)]  # type: ignore[call-overload]
+        except (KeyError, TypeError, ValueError):
+            raise EmojiPackError(f"Emoji not in pack: {emoji_id}")
+
+        payload = memoryview(self.map)[entry.offset : entry.offset + entry.length]
+        if entry.codec == CODEC_ZLIB:
+            payload = zlib.decompress(payload)
+        return numpy.frombuffer(payload, dtype=numpy.uint8).reshape(
+            entry.height, entry.width, 4
+        )
+
+
+def write_emoji_pack(
+    emojis: Iterable[Tuple[int, numpy.ndarray]], path: str, compress: bool = True
+) -> int:
+    """Write (id, RGBA array) pairs to a pack file, returning the emoji count."""
+    emojis = sorted(emojis, key=lambda emoji: emoji[0])
+    offset = HEADER.size + len(emojis) * ENTRY.size
+
+    index = []
+    payloads = []
+    for emoji_id, rgba in emojis:
+        height, width = rgba.shape[:2]
+        payload = numpy.ascontiguousarray(rgba, dtype=numpy.uint8).tobytes()
+        if compress:
+            payload = zlib.compress(payload, 9)
+        codec = CODEC_ZLIB if compress else CODEC_RAW
+        index.append(ENTRY.pack(emoji_id, width, height, offset, len(payload), codec))
+        payloads.append(payload)
+        offset += len(payload)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(emojis)))
+        f.writelines(index)
+        f.writelines(payloads)
+    return len(emojis)
+
+
+_pack: Optional[EmojiPack] = None
+_pack_lock = threading.Lock()
+
+
+def get_pack() -> EmojiPack:
+    """The emoji pack shipped with the package, opened on first use."""
+    global _pack
+    if _pack is None:
+        with _pack_lock:
+            if _pack is None:
+                _pack = EmojiPack(PACK_PATH)
+    return _pack
@@ -0,0 +1,216 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from itertools import chain
+import logging
+import re
+
+import numpy
+
+from .config import (
+    EMOJI_MATCH_BATCH,
+    EMOJI_MATCH_THRESHOLD,
+    EMOJI_VECTOR_DIMENSIONS,
+)
+
+logger = logging.getLogger("shortcap.emoji_vectors")
+
+SPACE = ord(" ")
+
+NOT_LETTERS = re.compile(r"[^a-z\s]+")
+VOWELS = set("aeiouy")
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """Strip the common English inflections off a lowercase word.
+
+    Plurals ("puppies", "boxes", "dogs"), "-ing" and "-ed" forms and a
+    final "e" are removed, so "dance", "dancing" and "danced" all give
+    "danc". Stems are only compared with stems, so they needn't be words;
+    short words and stems without a vowel are left alone.
+    """
+    if len(word) <= 3:
+        return word
+
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith(("sses", "xes", "zes", "ches", "shes")):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    else:
+        for suffix in ("ing", "ed"):
+            base = word[: -len(suffix)]
+            if word.endswith(suffix) and len(base) >= 3 and VOWELS & set(base):
+                # "running", "stopped"
+                if base[-1] == base[-2] and base[-1] not in "lsz":
+                    base = base[:-1]
+                word = base
+                break
+
+    if word.endswith("e") and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def split_words(text: str) -> List[str]:
+    """Lowercase words of `text`, reduced to ASCII letters like _trigrams does."""
+    return NOT_LETTERS.sub("", text.lower()).split()
+
+
+def _trigrams(
+    texts: Sequence[str],
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Trigram keys of the words of `texts`, with the word each belongs to.
+
+    Texts are lowercased and reduced to ASCII letters and spaces (what
+    isn't a letter or whitespace is dropped, like
+    remove_punctuation_and_whitespace does). Each word is padded with
+    spaces, so " pizza " gives " pi", "piz", ..., "za ". Returns the keys,
+    the word of each key, and the text of each word and the word count.
+    """
+    encoded = [(" " + text.lower() + " ").encode("utf-8") for text in texts]
+    chars = numpy.frombuffer(b"".join(encoded), dtype=numpy.uint8)
+    owners = numpy.repeat(numpy.arange(len(texts)), [len(text) for text in encoded])
+
+    letters = (chars >= ord("a")) & (chars <= ord("z"))
+    keep = letters | (chars <= SPACE)
+    chars = numpy.where(letters, chars, SPACE)[keep].astype(numpy.uint64)
+    letters, owners = letters[keep], owners[keep]
+
+    word_starts = letters.copy()
+    word_starts[1:] &= ~letters[:-1]
+    words = numpy.cumsum(word_starts) - 1
+
+    # A trigram belongs to the word of its middle letter
+    middle = numpy.flatnonzero(letters[1:-1]) + 1
+    keys = (chars[middle - 1] << 16) | (chars[middle] << 8) | chars[middle + 1]
+    return keys, words[middle], owners[word_starts], int(word_starts.sum())
+
+
+def _vectors(
+    keys: numpy.ndarray, rows: numpy.ndarray, row_count: int, dimensions: int
+) -> numpy.ndarray:
+    """Unit vectors counting the trigram keys of each row in hashed buckets."""
+    shift = numpy.uint64(64 - (dimensions.bit_length() - 1))
+    buckets = (keys * numpy.uint64(0x9E3779B97F4A7C15)) >> shift
+    counts = numpy.bincount(
+        rows * dimensions + buckets.astype(numpy.int64),
+        minlength=row_count * dimensions,
+    )
+    vectors = counts.reshape(row_count, dimensions).astype(numpy.float32)
+    vectors /= numpy.maximum(numpy.linalg.norm(vectors, axis=1, keepdims=True), 1e-6)
+    return vectors
+
+
+def text_vectors(
+    texts: Sequence[str], dimensions: int = EMOJI_VECTOR_DIMENSIONS
+) -> numpy.ndarray:
+    """One unit trigram vector per text, all of its words together."""
+    keys, words, owners, _ = _trigrams(texts)
+    return _vectors(keys, owners[words], len(texts), dimensions)
+
+
+class EmojiVectors:
+    """Fuzzy emoji matcher: keywords and caption words as trigram vectors.
+
+    Every keyword of the lexicon is one row of a normalized matrix. The
+    distinct words of all captions are stemmed and scored, in batches,
+    against the keywords that may match them. Inflections ("dogs", "puppies",
+    "dancing") score 1 like exact matches. A keyword only counts for the
+    words its stem (or the stem of one of its words) begins, so "other"
+    can't take the emoji of "mother", while "rockets" still gets "rocket".
+    """
+
+    def __init__(
+        self,
+        numbers: Sequence[str],
+        keywords: Sequence[str],
+        dimensions: int = EMOJI_VECTOR_DIMENSIONS,
+    ):
+        if dimensions & (dimensions - 1):
+            raise ValueError(f"Vector dimensions must be a power of two: {dimensions}")
+        self.dimensions = dimensions
+
+        # Reversed, so taking the first of equally scored rows prefers the
+        # emoji listed last, like the keyword index
+        self.numbers = numpy.array(list(numbers)[::-1], dtype=object)
+        stemmed = [
+            [stem(word) for word in split_words(keyword)]
+            for keyword in list(keywords)[::-1]
+        ]
+        self.matrix = text_vectors([" ".join(words) for words in stemmed], dimensions)
+
+        # Keyword rows by the stems of their words
+        self.rows: Dict[str, List[int]] = {}
+        for row, words in enumerate(stemmed):
+            for word in dict.fromkeys(words):
+                self.rows.setdefault(word, []).append(row)
+
+    def _candidates(self, stems: Sequence[str]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Pairs of stem and keyword row where a keyword stem begins the stem."""
+        pairs = [
+            (index, row)
+            for index, word in enumerate(stems)
+            for end in range(1, len(word) + 1)
+            for row in self.rows.get(word[:end], ())
+        ]
+        if not pairs:
+            return numpy.empty(0, dtype=numpy.int64), numpy.empty(0, dtype=numpy.int64)
+        indices, rows = numpy.array(pairs, dtype=numpy.int64).T
+        return indices, rows
+
+    def match(
+        self,
+        sentences: Sequence[str],
+        threshold: float = EMOJI_MATCH_THRESHOLD,
+        batch: int = EMOJI_MATCH_BATCH,
+    ) -> List[Optional[str]]:
+        """Best emoji id of each sentence, or None when no word is similar enough.
+
+        Of equally similar words in a sentence, the last one wins.
+        """
+        matches = numpy.full(len(sentences), None, dtype=object)
+        sentence_words = [split_words(sentence) for sentence in sentences]
+        all_words = list(chain.from_iterable(sentence_words))
+
+        # Each distinct word is stemmed, vectorized and scored once
+        index = {word: i for i, word in enumerate(dict.fromkeys(all_words))}
+        stems = [stem(word) for word in index]
+        if not stems or not len(self.matrix):
+            return matches.tolist()
+        word_ids = numpy.fromiter(
+            map(index.__getitem__, all_words), dtype=numpy.int64, count=len(all_words)
+        )
+        owners = numpy.repeat(
+            numpy.arange(len(sentences)), [len(words) for words in sentence_words]
+        )
+        vectors = text_vectors(stems, self.dimensions)
+        candidates, candidate_rows = self._candidates(stems)
+
+        scores = numpy.empty(len(candidates), dtype=numpy.float32)
+        for start in range(0, len(candidates), batch):
+            scores[start : start + batch] = numpy.einsum(
+                "ij,ij->i",
+                vectors[candidates[start : start + batch]],
+                self.matrix[candidate_rows[start : start + batch]],
+            )
+
+        # Best keyword of each word, the first row of equal scores
+        order = numpy.lexsort((candidate_rows, -scores, candidates))
+        first = numpy.ones(len(order), dtype=bool)
+        first[1:] = candidates[order[1:]] != candidates[order[:-1]]
+        best_rows = numpy.zeros(len(stems), dtype=numpy.int64)
+        best_scores = numpy.full(len(stems), -1, dtype=numpy.float32)
+        best_rows[candidates[order[first]]] = candidate_rows[order[first]]
+        best_scores[candidates[order[first]]] = scores[order[first]]
+
+        rows, scores = best_rows[word_ids], best_scores[word_ids]
+        accepted = scores >= threshold
+        best = numpy.full(len(sentences), -1, dtype=numpy.float32)
+        numpy.maximum.at(best, owners[accepted], scores[accepted])
+
+        # Assigned in word order, so the last of the best words is kept
+        winners = accepted & (scores >= best[owners])
+        matches[owners[winners]] = self.numbers[rows[winners]]
+        return matches.tolist()
@@ -0,0 +1,166 @@
+from PIL import ImageFont
+from typing import Dict, Tuple
+import logging
+import math
+import os
+import threading
+
+from .cache import SpriteCache
+from .config import ADVANCE_CACHE_BYTES
+
+logger = logging.getLogger("shortcap.fonts")
+
+# Fonts shipped with the package, found by file name
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "fonts")
+FONT_EXTENSIONS = (".ttf", ".otf")
+
+# Names FreeType can find among the system fonts on its own
+SYSTEM_FONTS = ("Arial", "Helvetica")
+
+
+# Advances are floats, so entries are counted at the rough size of their
+# key (path, size and text) and value instead of measured
+ADVANCE_ENTRY_BYTES = 256
+
+advance_cache = SpriteCache(
+    "advance", ADVANCE_CACHE_BYTES, sizeof=lambda advance: ADVANCE_ENTRY_BYTES
+)
+
+
+class FontError(Exception):
+    """Custom exception class for handling errors during font loading"""
+
+    pass
+
+
+class FontFace:
+    """A FreeType face at one size, with its metrics, advances and kerning cached.
+
+    Faces are shared by every thread, so kerning is a plain dict filled
+    with values that are the same whichever thread computes them. Advances
+    of characters and words go to the shared, bounded `advance_cache`;
+    text with spaces in it (whole lines) is measured without being kept.
+    """
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+        try:
+            self.font = ImageFont.truetype(path, size)
+        except OSError as e:
+            logger.error(f"Failed to load font {path}: {str(e)}")
+            raise FontError(f"Failed to load font {path}: {str(e)}")
+
+        self.ascent, self.descent = self.font.getmetrics()
+        self.kerning_pairs: Dict[Tuple[str, str], float] = {}
+
+    def advance(self, text: str) -> float:
+        if " " in text:
+            return self.font.getlength(text)
+
+        key = (self.path, self.size, text)
+        advance = advance_cache.get(key)
+        if advance is None:
+            advance = self.font.getlength(text)
+            advance_cache.put(key, advance)
+        return advance
+
+    def kerning(self, left: str, right: str) -> float:
+        """Adjustment of the pen between two characters, from the font's pair advances."""
+        pair = (left, right)
+        kerning = self.kerning_pairs.get(pair)
+        if kerning is None:
+            kerning = self.kerning_pairs[pair] = (
+                self.font.getlength(left + right)
+                - self.advance(left)
+                - self.advance(right)
+            )
+        return kerning
+
+
+class FontRegistry:
+    """Process-wide registry loading each (font, size) face only once.
+
+    Fonts are given as a path, a bundled font file name (with or without
+    its extension) or a system font name; every spelling of the same file
+    shares one face.
+    """
+
+    def __init__(self, fonts_dir: str = FONTS_DIR):
+        self.fonts_dir = fonts_dir
+        self.paths: Dict[str, str] = {}
+        self.faces: Dict[Tuple[str, int], FontFace] = {}
+        self.lock = threading.Lock()
+
+    def resolve(self, font: str) -> str:
+        path = self.paths.get(font)
+        if path is None:
+            path = self.paths[font] = self._find(font)
+        return path
+
+    def _find(self, font: str) -> str:
+        if os.path.exists(font):
+            return os.path.abspath(font)
+
+        if font in SYSTEM_FONTS:
+            return font
+
+        # Bundled fonts are only listed the first time one is asked for
+        name = os.path.basename(font)
+        for candidate in (name,) + tuple(name + ext for ext in FONT_EXTENSIONS):
+            path = os.path.join(self.fonts_dir, candidate)
+            if os.path.isfile(path):
+                return path
+
+        raise FontError(f"Font not found: {font}")
+
+    def face(self, font: str, size: int) -> FontFace:
+        key = (self.resolve(font), size)
+        face = self.faces.get(key)
+        if face is None:
+            # FreeType parses the file once, whichever thread gets here first
+            with self.lock:
+                face = self.faces.get(key)
+                if face is None:
+                    face = self.faces[key] = FontFace(*key)
+        return face
+
+
+registry = FontRegistry()
+
+
+def resolve_font(font: str) -> str:
+    """Path of a font file, a bundled font name or a system font name."""
+    return registry.resolve(font)
+
+
+def get_face(font: str, fontsize: int) -> FontFace:
+    return registry.face(font, fontsize)
+
+
+def load_font(font: str, fontsize: int) -> ImageFont.FreeTypeFont:
+    return registry.face(font, fontsize).font
+
+
+def text_canvas_size(
+    pil_font: ImageFont.FreeTypeFont, text: str, stroke_width: int, kerning: float = 0.0
+) -> Tuple[int, int]:
+    """Size of the canvas the Pillow backend draws `text` on.
+
+    The stroke is always reserved around the text, so measuring and drawing
+    agree whether or not a stroke color is set.
+    """
+    ascent, descent = pil_font.getmetrics()
+    advance = pil_font.getlength(text) + kerning * max(len(text) - 1, 0)
+    width = max(math.ceil(advance) + 2 * stroke_width, 1)
+    height = ascent + descent + 2 * stroke_width
+    return width, height
+
+
+def measure_text(
+    text: str, font: str, fontsize: int, stroke_width: int
+) -> Tuple[int, int]:
+    """Width and height of rendered text, from font metrics only."""
+    face = get_face(font, fontsize)
+    width = max(math.ceil(face.font.getlength(text)) + 2 * stroke_width, 1)
+    return width, face.ascent + face.descent + 2 * stroke_width
@@ -0,0 +1,238 @@
+from PIL import Image, ImageDraw
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import math
+import numpy
+import threading
+
+from .cache import SpriteCache
+from .config import GLYPH_CACHE_BYTES
+from .fonts import get_face, load_font, text_canvas_size
+
+ATLAS_WIDTH = 1024
+STROKE_LAYER = 0
+FILL_LAYER = 1
+
+atlas_cache = SpriteCache("glyph_atlas", GLYPH_CACHE_BYTES)
+
+
+class Glyph(NamedTuple):
+    # Location of the glyph in the atlas texture
+    x: int
+    y: int
+    width: int
+    height: int
+    # Offset of the glyph box from the pen position (ascender line)
+    offset_x: int
+    offset_y: int
+    advance: float
+
+
+class GlyphAtlas:
+    """Glyphs of one text style, rasterized once and packed into a texture.
+
+    The texture holds two premultiplied RGBA layers, the stroke and the
+    fill, so a line can be composed like Pillow draws it: every stroke
+    first, then every fill on top.
+    """
+
+    def __init__(
+        self,
+        font: str,
+        fontsize: int,
+        stroke_width: int,
+        color: Tuple[int, int, int],
+        stroke_color: Optional[Tuple[int, int, int]],
+    ):
+        self.face = get_face(font, fontsize)
+        self.font = self.face.font
+        self.stroke_width = stroke_width
+        self.color = color
+        self.stroke_color = stroke_color if stroke_width else None
+
+        self.texture = numpy.zeros((2, 64, ATLAS_WIDTH, 4), dtype=numpy.uint8)
+        self.glyphs: Dict[str, Glyph] = {}
+        self.lock = threading.Lock()
+        # Called after the texture is replaced by a larger one
+        self.on_grow: Optional[Callable[[], None]] = None
+
+        # Shelf packing state
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def glyph(self, char: str) -> Glyph:
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            # Packing mutates the texture, so one thread rasterizes at a time
+            with self.lock:
+                glyph = self.glyphs.get(char)
+                if glyph is None:
+                    glyph = self.glyphs[char] = self._rasterize(char)
+        return glyph
+
+    def kerning(self, left: str, right: str) -> float:
+        # Shared by the atlases of every color of the face
+        return self.face.kerning(left, right)
+
+    def sprite(self, glyph: Glyph, layer: int) -> numpy.ndarray:
+        return self.texture[
+            layer, glyph.y : glyph.y + glyph.height, glyph.x : glyph.x + glyph.width
+        ]
+
+    def _rasterize(self, char: str) -> Glyph:
+        sw = self.stroke_width
+        advance = self.face.advance(char)
+        x0, y0, x1, y1 = self.font.getbbox(char, stroke_width=sw, anchor="la")
+        width, height = max(x1 - x0, 0), max(y1 - y0, 0)
+        if not width or not height:
+            return Glyph(0, 0, 0, 0, 0, 0, advance)
+
+        x, y = self._allocate(width, height)
+
+        fill = Image.new("L", (width, height))
+        ImageDraw.Draw(fill).text(
+            (-x0, -y0), char, font=self.font, fill=255, anchor="la"
+        )
+        self._store(FILL_LAYER, x, y, numpy.asarray(fill), self.color)
+
+        if self.stroke_color:
+            stroke = Image.new("L", (width, height))
+            ImageDraw.Draw(stroke).text(
+                (-x0, -y0),
+                char,
+                font=self.font,
+                fill=255,
+                anchor="la",
+                stroke_width=sw,
+                stroke_fill=255,
+            )
+            self._store(STROKE_LAYER, x, y, numpy.asarray(stroke), self.stroke_color)
+
+        return Glyph(x, y, width, height, x0, y0, advance)
+
+    def _store(
+        self,
+        layer: int,
+        x: int,
+        y: int,
+        coverage: numpy.ndarray,
+        color: Tuple[int, int, int],
+    ) -> None:
+        height, width = coverage.shape
+        region = self.texture[layer, y : y + height, x : x + width]
+        region[..., :3] = (
+            coverage[..., None].astype(numpy.uint16) * numpy.array(color, numpy.uint16)
+            + 127
+        ) // 255
+        region[..., 3] = coverage
+
+    def _allocate(self, width: int, height: int) -> Tuple[int, int]:
+        if width > self.texture.shape[2]:
+            self._grow(self.texture.shape[1], 2 ** math.ceil(math.log2(width)))
+
+        if self.shelf_x + width > self.texture.shape[2]:
+            self.shelf_x = 0
+            self.shelf_y += self.shelf_height
+            self.shelf_height = 0
+
+        if self.shelf_y + height > self.texture.shape[1]:
+            self._grow(
+                max(self.texture.shape[1] * 2, self.shelf_y + height),
+                self.texture.shape[2],
+            )
+
+        x, y = self.shelf_x, self.shelf_y
+        self.shelf_x += width
+        self.shelf_height = max(self.shelf_height, height)
+        return x, y
+
+    def _grow(self, height: int, width: int) -> None:
+        texture = numpy.zeros((2, height, width, 4), dtype=numpy.uint8)
+        old_height, old_width = self.texture.shape[1:3]
+        texture[:, :old_height, :old_width] = self.texture
+        self.texture = texture
+        if self.on_grow is not None:
+            self.on_grow()
+
+
+def get_atlas(
+    font: str,
+    fontsize: int,
+    stroke_width: int,
+    color: Tuple[int, int, int],
+    stroke_color: Optional[Tuple[int, int, int]],
+) -> GlyphAtlas:
+    key = (font, fontsize, stroke_width, color, stroke_color)
+    atlas = atlas_cache.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(*key)
+        atlas.on_grow = lambda: _account(key, atlas)
+        atlas_cache.put(key, atlas)
+    return atlas
+
+
+def _account(key: tuple, atlas: GlyphAtlas) -> None:
+    # Stored again so the cache counts the larger texture, unless evicted
+    if key in atlas_cache:
+        atlas_cache.put(key, atlas)
+
+
+def compose_text(
+    chars: Sequence[Tuple[str, Tuple[int, int, int]]],
+    fontsize: int,
+    font: str,
+    stroke_color: Optional[Tuple[int, int, int]] = None,
+    stroke_width: int = 1,
+    opacity: float = 1.0,
+) -> numpy.ndarray:
+    """Compose a line of (character, RGB color) pairs by blitting atlas glyphs.
+
+    The result has the same size as the Pillow rasterizer's canvas for the
+    same text.
+    """
+    text = "".join(char for char, _ in chars)
+    width, height = text_canvas_size(load_font(font, fontsize), text, stroke_width)
+    canvas = numpy.zeros((height, width, 4), dtype=numpy.float32)
+
+    placements: List[Tuple[GlyphAtlas, Glyph, int, int]] = []
+    pen_x = float(stroke_width)
+    previous = None
+    for char, color in chars:
+        atlas = get_atlas(font, fontsize, stroke_width, color, stroke_color)
+        if previous is not None:
+            pen_x += atlas.kerning(previous, char)
+        glyph = atlas.glyph(char)
+        placements.append(
+            (atlas, glyph, round(pen_x) + glyph.offset_x, stroke_width + glyph.offset_y)
+        )
+        pen_x += glyph.advance
+        previous = char
+
+    for layer in (STROKE_LAYER, FILL_LAYER):
+        for atlas, glyph, x, y in placements:
+            if layer == STROKE_LAYER and not atlas.stroke_color:
+                continue
+            blit(canvas, atlas.sprite(glyph, layer), x, y)
+
+    alpha = canvas[..., 3:]
+    rgba = numpy.empty((height, width, 4), dtype=numpy.uint8)
+    rgba[..., :3] = numpy.clip(
+        canvas[..., :3] * 255 / numpy.maximum(alpha, 1e-6) + 0.5, 0, 255
+    )
+    rgba[..., 3] = numpy.clip(alpha[..., 0] * opacity + 0.5, 0, 255)
+    return rgba
+
+
+def blit(canvas: numpy.ndarray, sprite: numpy.ndarray, x: int, y: int) -> None:
+    """Alpha-composite a premultiplied uint8 sprite over a float canvas."""
+    height, width = canvas.shape[:2]
+    left, top = max(x, 0), max(y, 0)
+    right = min(x + sprite.shape[1], width)
+    bottom = min(y + sprite.shape[0], height)
+    if right <= left or bottom <= top:
+        return
+
+    src = sprite[top - y : bottom - y, left - x : right - x].astype(numpy.float32)
+    dst = canvas[top:bottom, left:right]
+    dst *= 1 - src[..., 3:] / 255
+    dst += src
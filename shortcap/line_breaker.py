@@ -0,0 +1,107 @@
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Tuple
+import logging
+import math
+
+from .fonts import get_face
+
+logger = logging.getLogger("shortcap.line_breaker")
+
+
+class LineBreaker:
+    """Greedy line breaking from word advances that are measured only once.
+
+    A line fits when its rendered width, as `fonts.measure_text` would
+    report it, is below `text_bbox_width`. Widths are sums of word and
+    space advances, so break points are found by arithmetic on prefix sums
+    instead of re-measuring every candidate line.
+    """
+
+    def __init__(
+        self, font: str, font_size: int, stroke_width: int, text_bbox_width: int
+    ):
+        # Word advances are cached in fonts.advance_cache, shared by every breaker
+        self.face = get_face(font, font_size)
+        self.stroke_width = stroke_width
+        self.text_bbox_width = text_bbox_width
+
+        self.line_height = self.face.ascent + self.face.descent + 2 * stroke_width
+        self.space_advance = self.face.advance(" ")
+        self.advance = self.face.advance
+
+    def fits(self, advance: float) -> bool:
+        return math.ceil(advance) + 2 * self.stroke_width < self.text_bbox_width
+
+    def break_lines(self, words: List[str]) -> List[Tuple[int, int]]:
+        """Split words into greedy lines, returned as [start, end) word ranges."""
+        # offsets[i] is the advance of words[:i], each followed by a space
+        offsets = [0.0]
+        offsets.extend(
+            accumulate(self.advance(word) + self.space_advance for word in words)
+        )
+
+        # ceil(x) + 2 * stroke < bbox  <=>  x <= bbox - 2 * stroke - 1
+        max_advance = self.text_bbox_width - 2 * self.stroke_width - 1
+
+        lines = []
+        start = 0
+        while start < len(words):
+            limit = offsets[start] + self.space_advance + max_advance
+            end = min(bisect_right(offsets, limit) - 1, len(words))
+            if end <= start:
+                logger.warning(f"Word '{words[start]}' is too long for the frame!")
+                end = start + 1
+            lines.append((start, end))
+            start = end
+
+        return lines
+
+
+class LineFitter:
+    """Checks whether a caption still fits in `line_count` lines.
+
+    Calling it with a full caption text lays the text out from scratch,
+    which keeps it usable as a plain `fit_function`. `fits`, `append` and
+    `reset` track the last line of a growing caption instead, so
+    `segment_parser.parse` can test each new word in constant time.
+    """
+
+    def __init__(self, breaker: LineBreaker, line_count: int):
+        self.breaker = breaker
+        self.line_count = line_count
+        self.reset()
+
+    def __call__(self, text: str) -> bool:
+        return len(self.breaker.break_lines(text.split())) <= self.line_count
+
+    def reset(self) -> None:
+        self.lines = 0
+        self.line_advance = 0.0
+
+    def fits(self, word: str) -> bool:
+        lines, _ = self._layout(word)
+        return lines <= self.line_count
+
+    def append(self, word: str) -> None:
+        self.lines, self.line_advance = self._layout(word)
+
+    def _layout(self, word: str) -> Tuple[int, float]:
+        lines, line_advance = self.lines, self.line_advance
+        for token in word.split():
+            advance = self.breaker.advance(token)
+            extended = line_advance + self.breaker.space_advance + advance
+            if lines and self.breaker.fits(extended):
+                line_advance = extended
+            else:
+                lines += 1
+                line_advance = advance
+        return lines, line_advance
+
+
+@lru_cache(maxsize=64)
+def get_line_breaker(
+    font: str, font_size: int, stroke_width: int, text_bbox_width: int
+) -> LineBreaker:
+    return LineBreaker(font, font_size, stroke_width, text_bbox_width)
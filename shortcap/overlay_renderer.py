@@ -0,0 +1,114 @@
+from PIL import Image
+from typing import Dict, List, Sequence
+import logging
+import os
+import subprocess
+import tempfile
+
+from .caption_layer import Sprite
+from .config import DEFAULT_ENCODING_PROFILE
+from .utils import encoder_args, ffmpeg, filter_escape
+
+logger = logging.getLogger("shortcap.overlay_renderer")
+
+
+class OverlayRenderError(Exception):
+    """Custom exception class for handling errors during overlay rendering"""
+
+    pass
+
+
+def write_sprite_images(sprites: Sequence[Sprite], directory: str) -> List[str]:
+    """Save each distinct sprite image once as a PNG, returning one path per sprite."""
+    paths: Dict[int, str] = {}
+    sprite_paths = []
+    for sprite in sprites:
+        path = paths.get(id(sprite.image))
+        if path is None:
+            path = os.path.join(directory, f"{len(paths)}.png")
+            # Fast compression: the files are read back once, right away
+            Image.fromarray(sprite.image, "RGBA").save(path, compress_level=1)
+            paths[id(sprite.image)] = path
+        sprite_paths.append(path)
+    return sprite_paths
+
+
+def build_overlay_graph(sprites: Sequence[Sprite], sprite_paths: List[str]) -> str:
+    """Chain one overlay filter per sprite onto the input video.
+
+    Each PNG is a one-frame `movie` source, which overlay repeats for the
+    whole video; `enable` limits it to [start, end) like CaptionLayer does,
+    so consecutive highlight states never show on the same frame.
+    """
+    sources = {}
+    lines = []
+    for path in sprite_paths:
+        if path not in sources:
+            sources[path] = f"s{len(sources)}"
+
+    # A source pad can only be consumed once, so split shared images
+    uses: Dict[str, int] = {}
+    for path in sprite_paths:
+        uses[path] = uses.get(path, 0) + 1
+    for path, label in sources.items():
+        source = f"movie={filter_escape(path)},format=rgba"
+        if uses[path] > 1:
+            outputs = "".join(f"[{label}_{i}]" for i in range(uses[path]))
+            lines.append(f"{source},split={uses[path]}{outputs};")
+        else:
+            lines.append(f"{source}[{label}_0];")
+
+    taken: Dict[str, int] = {}
+    previous = "[0:v]"
+    for i, (sprite, path) in enumerate(zip(sprites, sprite_paths)):
+        label = sources[path]
+        index = taken.get(path, 0)
+        taken[path] = index + 1
+        output = "[v]" if i == len(sprites) - 1 else f"[v{i}]"
+        lines.append(
+            f"{previous}[{label}_{index}]overlay=x={sprite.x}:y={sprite.y}"
+            f":enable='gte(t,{sprite.start:.3f})*lt(t,{sprite.end:.3f})'{output};"
+        )
+        previous = output
+
+    if not sprites:
+        lines.append("[0:v]null[v];")
+
+    # No separator after the last filter
+    lines[-1] = lines[-1].rstrip(";")
+    return "\n".join(lines) + "\n"
+
+
+def render_overlay(
+    video_file: str,
+    output_file: str,
+    sprites: Sequence[Sprite],
+    profile: str = DEFAULT_ENCODING_PROFILE,
+) -> subprocess.CompletedProcess:
+    """Composite caption sprites with ffmpeg's overlay filter and encode in one pass."""
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            sprite_paths = write_sprite_images(sprites, directory)
+            graph_file = os.path.join(directory, "graph.txt")
+            with open(graph_file, "w", encoding="utf-8") as f:
+                f.write(build_overlay_graph(sprites, sprite_paths))
+
+            return ffmpeg(
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-i",
+                    video_file,
+                    "-filter_complex_script",
+                    graph_file,
+                    "-map",
+                    "[v]",
+                    "-map",
+                    "0:a?",
+                ]
+                + encoder_args(profile)
+                + ["-c:a", "copy", output_file]
+            )
+        except Exception as e:
+            logger.error(f"Failed to render overlays: {str(e)}")
+            raise OverlayRenderError(f"Failed to render overlays: {str(e)}")
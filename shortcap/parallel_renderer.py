@@ -0,0 +1,144 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+import logging
+import math
+import os
+import tempfile
+
+from .caption_layer import CaptionLayer, Sprite
+from .config import DEFAULT_ENCODING_PROFILE
+from .stream_renderer import render_stream
+from .utils import ffmpeg
+
+logger = logging.getLogger("shortcap.parallel_renderer")
+
+# Shorter chunks spend more time starting ffmpeg than rendering
+MIN_CHUNK_SECONDS = 2.0
+
+
+class ParallelRenderError(Exception):
+    """Custom exception class for handling errors during parallel rendering"""
+
+    pass
+
+
+def split_frames(
+    sprites: Sequence[Sprite], fps: float, frame_total: int, chunk_count: int
+) -> List[int]:
+    """Pick the first frame of each chunk, preferring frames without captions.
+
+    Chunks start at evenly spaced frames, each moved to the nearest moment
+    no sprite is visible if one lies within half a chunk, so a caption is
+    rarely split between two encoders.
+    """
+    chunk_frames = frame_total / chunk_count
+    layer = CaptionLayer(sprites)
+
+    # Stretches of time without any sprite, as [start, end) pairs
+    bounds = [0.0] + layer.change_points + [math.inf]
+    gaps = [(bounds[0], bounds[1])] + [
+        (bounds[i + 1], bounds[i + 2])
+        for i, active in enumerate(layer.active)
+        if not active
+    ]
+
+    starts = [0]
+    for i in range(1, chunk_count):
+        target = i * chunk_frames / fps
+        nearest = min(
+            (min(max(target, gap_start), gap_end) for gap_start, gap_end in gaps),
+            key=lambda time: abs(time - target),
+        )
+        if abs(nearest - target) * fps <= chunk_frames / 2:
+            frame = math.ceil(nearest * fps)
+        else:
+            frame = round(target * fps)
+        if starts[-1] < frame < frame_total:
+            starts.append(frame)
+    return starts
+
+
+def concat_parts(part_files: List[str], video_file: str, output_file: str) -> None:
+    """Join encoded parts without re-encoding and copy the input's audio back."""
+    list_file = os.path.join(os.path.dirname(part_files[0]), "parts.txt")
+    with open(list_file, "w", encoding="utf-8") as f:
+        for part_file in part_files:
+            f.write(f"file '{part_file}'\n")
+
+    ffmpeg(
+        [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            list_file,
+            "-i",
+            video_file,
+            "-map",
+            "0:v",
+            "-map",
+            "1:a?",
+            "-c",
+            "copy",
+            output_file,
+        ]
+    )
+
+
+def render_parallel(
+    video_file: str,
+    output_file: str,
+    sprites: Sequence[Sprite],
+    video_size: Tuple[int, int],
+    fps: float,
+    duration: float,
+    workers: Optional[int] = None,
+    profile: str = DEFAULT_ENCODING_PROFILE,
+) -> int:
+    """Render chunks of the video in worker processes, then concatenate them.
+
+    Each worker streams its own frame range with only the sprites visible
+    in it. Returns the number of chunks.
+    """
+    workers = workers or os.cpu_count() or 1
+    frame_total = max(int(round(duration * fps)), 1)
+    chunk_count = max(1, min(workers, int(duration // MIN_CHUNK_SECONDS)))
+    starts = split_frames(sprites, fps, frame_total, chunk_count)
+
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(starts))) as pool:
+                futures = []
+                part_files = []
+                for i, start_frame in enumerate(starts):
+                    end_frame = starts[i + 1] if i + 1 < len(starts) else None
+                    start, end = start_frame / fps, (end_frame or math.inf) / fps
+                    part_file = os.path.join(directory, f"part{i:04d}.mp4")
+                    part_files.append(part_file)
+                    futures.append(
+                        pool.submit(
+                            render_stream,
+                            video_file,
+                            part_file,
+                            [s for s in sprites if s.start < end and s.end > start],
+                            video_size,
+                            fps,
+                            start_frame=start_frame,
+                            frame_count=end_frame - start_frame if end_frame else None,
+                            audio=False,
+                            profile=profile,
+                        )
+                    )
+
+                frames = sum(future.result() for future in futures)
+
+            logger.info(f"Rendered {frames} frames in {len(starts)} chunks")
+            concat_parts(part_files, video_file, output_file)
+        except Exception as e:
+            logger.error(f"Failed to render in parallel: {str(e)}")
+            raise ParallelRenderError(f"Failed to render in parallel: {str(e)}")
+
+    return len(starts)
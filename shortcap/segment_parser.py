@@ -1,6 +1,8 @@
 from typing import List, Dict, Callable, Any
 import logging
 
+from .line_breaker import LineFitter
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +68,11 @@ def parse(
                 #   segments[s]["words"][w-1]["end"] = word["end"]
                 #   del segments[s]["words"][w]
 
+        # Line fitters can check each appended word without re-laying out the caption
+        incremental = isinstance(fit_function, LineFitter)
+        if incremental:
+            fit_function.reset()
+
         # Parse segments into captions that fit on the video
         for segment in segments:
             for word in segment["words"]:
@@ -75,12 +82,17 @@ def parse(
                 text = caption["text"] + " " + word["word"]
 
                 caption_fits = allow_partial_sentences or not has_partial_sentence(text)
-                caption_fits = caption_fits and fit_function(text)
+                if incremental:
+                    caption_fits = caption_fits and fit_function.fits(word["word"])
+                else:
+                    caption_fits = caption_fits and fit_function(text)
 
                 if caption_fits:
                     caption["words"].append(word)
                     caption["end"] = word["end"]
                     caption["text"] = text
+                    if incremental:
+                        fit_function.append(word["word"])
                 else:
                     captions.append(caption)
                     caption = {
@@ -90,6 +102,9 @@ def parse(
                         "text": word["word"],
                         "emoji": None,
                     }
+                    if incremental:
+                        fit_function.reset()
+                        fit_function.append(word["word"])
 
         captions.append(caption)
         return captions
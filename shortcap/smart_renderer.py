@@ -0,0 +1,252 @@
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import json
+import logging
+import math
+import os
+import tempfile
+
+from .caption_layer import CaptionLayer, Sprite
+from .config import DEFAULT_ENCODING_PROFILE, ENCODING_PROFILES
+from .parallel_renderer import concat_parts
+from .stream_renderer import render_stream
+from .utils import ffmpeg
+
+logger = logging.getLogger("shortcap.smart_renderer")
+
+
+class SmartRenderError(Exception):
+    """Custom exception class for handling errors during smart rendering"""
+
+    pass
+
+
+# libx264 profiles matching the ones ffprobe reports for 8-bit 4:2:0 H.264
+H264_PROFILES = {
+    "Constrained Baseline": "baseline",
+    "Baseline": "baseline",
+    "Main": "main",
+    "High": "high",
+}
+
+
+class Keyframe(NamedTuple):
+    time: float
+    frame: int
+
+
+class Span(NamedTuple):
+    start_frame: int
+    end_frame: int
+    start_time: float
+    end_time: Optional[float]
+    captioned: bool
+
+
+def probe_keyframes(video_file: str) -> List[Keyframe]:
+    """Keyframes of the first video stream, from the packets flagged as such.
+
+    Times are exact, from the packet timestamps, and relative to the start
+    of the stream. Packets are listed in decoding order, and every frame
+    decoded before a keyframe is shown before it, so a keyframe's packet
+    index is also its frame number.
+    """
+    result = ffmpeg(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "packet=pts,flags:stream=time_base,start_pts",
+            "-of",
+            "json",
+            video_file,
+        ]
+    )
+    probe = json.loads(result.stdout)
+    stream = probe["streams"][0]
+    time_base = Fraction(stream["time_base"])
+    start_pts = int(stream.get("start_pts", 0))
+
+    keyframes = []
+    for frame, packet in enumerate(probe.get("packets", [])):
+        if "K" in packet.get("flags", "") and "pts" in packet:
+            time = (int(packet["pts"]) - start_pts) * time_base
+            keyframes.append(Keyframe(float(time), frame))
+    return sorted(keyframes)
+
+
+def encoder_profile(video_stream: Dict[str, Any]) -> Optional[List[str]]:
+    """libx264 options reproducing the profile and level of an H.264 stream.
+
+    None when the stream can't be stream-copied next to libx264 output:
+    another codec or pixel format, a rotation (re-encoded frames are
+    upright) or an unknown profile. Parts joined with -c copy keep the
+    first part's decoder configuration in the MP4 header; MPEG-TS repeats
+    SPS/PPS in band, so players pick up each part's own parameters, but
+    only within the profile and level the header announces.
+    """
+    rotation = int(video_stream.get("tags", {}).get("rotate", 0))
+    for side_data in video_stream.get("side_data_list", []):
+        rotation = int(side_data.get("rotation", rotation))
+
+    profile = H264_PROFILES.get(video_stream.get("profile", ""))
+    level = int(video_stream.get("level", -1))
+    if (
+        video_stream.get("codec_name") != "h264"
+        or video_stream.get("pix_fmt") != "yuv420p"
+        or rotation % 360
+        or profile is None
+        or level <= 0
+    ):
+        return None
+    return ["-profile:v", profile, "-level", str(level)]
+
+
+def plan_spans(
+    sprites: Sequence[Sprite],
+    keyframes: List[Keyframe],
+    fps: float,
+    frame_total: int,
+) -> List[Span]:
+    """Split the video at keyframes into spans that do or don't show captions.
+
+    Each GOP (keyframe to next keyframe) without any visible sprite can be
+    copied as is; neighbouring GOPs of the same kind are merged.
+    """
+    layer = CaptionLayer(sprites)
+    starts = [keyframe for keyframe in keyframes if 0 < keyframe.frame < frame_total]
+    starts.insert(0, Keyframe(0.0, 0))
+
+    spans: List[Span] = []
+    for i, keyframe in enumerate(starts):
+        last = i + 1 == len(starts)
+        end_frame = frame_total if last else starts[i + 1].frame
+        end_time = None if last else starts[i + 1].time
+        start, end = keyframe.time, frame_total / fps if last else end_time
+        captioned = bool(layer.active_sprites(start)) or bisect_right(
+            layer.change_points, start
+        ) < bisect_left(layer.change_points, end)
+
+        if spans and spans[-1].captioned == captioned:
+            spans[-1] = spans[-1]._replace(end_frame=end_frame, end_time=end_time)
+        else:
+            spans.append(
+                Span(keyframe.frame, end_frame, keyframe.time, end_time, captioned)
+            )
+    return spans
+
+
+def copy_span(
+    video_file: str,
+    part_file: str,
+    start_time: float,
+    frame_count: Optional[int],
+) -> None:
+    # Seeking while copying starts on the last keyframe at or before the
+    # time, so it's rounded up to ffmpeg's microseconds, never below
+    seek = math.ceil(start_time * 1e6) / 1e6
+    limit = ["-frames:v", str(frame_count)] if frame_count is not None else []
+    ffmpeg(
+        ["ffmpeg", "-y", "-ss", f"{seek:.6f}", "-i", video_file]
+        + limit
+        + [
+            "-map",
+            "0:v",
+            "-c",
+            "copy",
+            "-avoid_negative_ts",
+            "make_zero",
+            part_file,
+        ]
+    )
+
+
+def render_smart(
+    video_file: str,
+    output_file: str,
+    sprites: Sequence[Sprite],
+    video_size: Tuple[int, int],
+    fps: float,
+    duration: float,
+    video_stream: Dict[str, Any],
+    profile: str = DEFAULT_ENCODING_PROFILE,
+) -> Tuple[int, int]:
+    """Re-encode only the GOPs that show captions and stream-copy the rest.
+
+    Parts are written as MPEG-TS, which carries the codec parameters in
+    band, so copied and re-encoded H.264 can be joined by the concat
+    demuxer. Re-encoded parts use the profile and level of the probed
+    `video_stream`. Inputs that can't be copied next to the profile's
+    output (see encoder_profile, and frames not coded at `video_size`) are
+    fully re-encoded. Returns the number of (re-encoded, copied) frames.
+    """
+    frame_total = max(int(round(duration * fps)), 1)
+
+    h264_args = encoder_profile(video_stream)
+    coded_size = (video_stream.get("width"), video_stream.get("height"))
+    copyable = (
+        ENCODING_PROFILES[profile]["codec"] == "libx264"
+        and h264_args is not None
+        and coded_size == tuple(video_size)
+    )
+    if not copyable:
+        logger.warning("Video stream can't be copied, re-encoding all of it")
+        try:
+            frames = render_stream(
+                video_file, output_file, sprites, video_size, fps, profile=profile
+            )
+        except Exception as e:
+            logger.error(f"Failed to render smart: {str(e)}")
+            raise SmartRenderError(f"Failed to render smart: {str(e)}")
+        return frames, 0
+
+    try:
+        keyframes = probe_keyframes(video_file)
+    except Exception as e:
+        logger.error(f"Failed to probe keyframes: {str(e)}")
+        raise SmartRenderError(f"Failed to probe keyframes: {str(e)}")
+
+    spans = plan_spans(sprites, keyframes, fps, frame_total)
+
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            part_files = []
+            for i, span in enumerate(spans):
+                part_file = os.path.join(directory, f"part{i:04d}.ts")
+                part_files.append(part_file)
+
+                # The last span runs to the end, whatever the rounded frame total
+                frame_count = span.end_frame - span.start_frame
+                if i == len(spans) - 1:
+                    frame_count = None
+
+                if span.captioned:
+                    start = span.start_time
+                    end = duration if span.end_time is None else span.end_time
+                    render_stream(
+                        video_file,
+                        part_file,
+                        [s for s in sprites if s.start < end and s.end > start],
+                        video_size,
+                        fps,
+                        start_frame=span.start_frame,
+                        frame_count=frame_count,
+                        audio=False,
+                        profile=profile,
+                        start_time=start,
+                        output_args=h264_args,
+                    )
+                else:
+                    copy_span(video_file, part_file, span.start_time, frame_count)
+
+            concat_parts(part_files, video_file, output_file)
+        except Exception as e:
+            logger.error(f"Failed to render smart: {str(e)}")
+            raise SmartRenderError(f"Failed to render smart: {str(e)}")
+
+    encoded = sum(s.end_frame - s.start_frame for s in spans if s.captioned)
+    return encoded, frame_total - encoded
@@ -0,0 +1,118 @@
+from typing import Optional, Sequence, Tuple
+import logging
+import math
+import numpy
+
+from .caption_layer import CaptionLayer, Sprite
+from .config import DEFAULT_ENCODING_PROFILE
+from .utils import encoder_args, ffmpeg_reader, ffmpeg_wait, ffmpeg_writer, read_frame
+
+logger = logging.getLogger("shortcap.stream_renderer")
+
+
+class StreamRenderError(Exception):
+    """Custom exception class for handling errors during stream rendering"""
+
+    pass
+
+
+def render_stream(
+    video_file: str,
+    output_file: str,
+    sprites: Sequence[Sprite],
+    video_size: Tuple[int, int],
+    fps: float,
+    start_frame: int = 0,
+    frame_count: Optional[int] = None,
+    audio: bool = True,
+    profile: str = DEFAULT_ENCODING_PROFILE,
+    start_time: Optional[float] = None,
+    output_args: Sequence[str] = (),
+) -> int:
+    """Decode, caption and encode a video one frame at a time.
+
+    One ffmpeg process decodes raw RGB frames into a single reused buffer.
+    The caption layer blends into it in place, and the same bytes are
+    piped to an encoding ffmpeg process, so memory doesn't grow with the
+    video's length. The audio stream is copied from the input unless
+    `audio` is False. The video is encoded with the ENCODING_PROFILES
+    `profile`. `start_frame` and `frame_count` render only part of the
+    video. Returns the number of frames written.
+
+    `start_time` seeks to an exact time (such as a keyframe's) instead of
+    that of `start_frame`, and `output_args` are extra encoder options.
+    """
+    width, height = video_size
+    layer = CaptionLayer(sprites)
+    frame = numpy.empty((height, width, 3), dtype=numpy.uint8)
+
+    # Seeking before -i is frame accurate when decoding: frames before the
+    # time are dropped, so it's rounded down to ffmpeg's microseconds
+    if start_time is None:
+        start_time = start_frame / fps
+    seek = ["-ss", f"{math.floor(start_time * 1e6) / 1e6:.6f}"] if start_time else []
+    limit = ["-frames:v", str(frame_count)] if frame_count is not None else []
+    audio_input = ["-i", video_file, "-map", "0:v", "-map", "1:a?", "-c:a", "copy"]
+
+    reader = ffmpeg_reader(
+        ["ffmpeg", "-loglevel", "error"]
+        + seek
+        + ["-i", video_file]
+        + limit
+        + [
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            f"{fps}",
+            "-",
+        ]
+    )
+    writer = ffmpeg_writer(
+        [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            f"{fps}",
+            "-i",
+            "-",
+        ]
+        + (audio_input if audio else [])
+        + encoder_args(profile)
+        + list(output_args)
+        + [output_file]
+    )
+
+    index = 0
+    try:
+        try:
+            while read_frame(reader, frame):
+                layer.blend(frame, start_time + index / fps)
+                writer.stdin.write(frame)
+                index += 1
+        except BrokenPipeError:
+            pass  # The encoder exited early; ffmpeg_wait reports why
+
+        ffmpeg_wait(writer)
+        ffmpeg_wait(reader)
+    except Exception as e:
+        for process in (reader, writer):
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.log.close()  # type: ignore[attr-defined]
+        logger.error(f"Failed to stream video: {str(e)}")
+        raise StreamRenderError(f"Failed to stream video: {str(e)}")
+
+    return index
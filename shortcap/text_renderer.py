@@ -1,15 +1,26 @@
-from moviepy.editor import TextClip, ImageClip, VideoClip, CompositeVideoClip
-from PIL import Image, ImageFilter, ImageFont
+from moviepy.editor import TextClip, ImageClip, VideoClip
+from PIL import Image, ImageColor, ImageDraw, ImageFilter
 import numpy
-import tempfile
 from typing import List, Union, Optional, Tuple
 import logging
-import os
-import pkg_resources
+
+from .cache import SpriteCache
+from .config import DEFAULT_TEXT_BACKEND, TEXT_CACHE_BYTES
+from .fonts import (
+    FontError,
+    get_face,
+    load_font,
+    measure_text,
+    resolve_font,
+    text_canvas_size,
+)
+from .glyph_atlas import compose_text
 
 logger = logging.getLogger("shortcap.text_renderer")
 
-text_cache = {}
+TEXT_BACKENDS = ("pillow", "imagemagick")
+
+text_cache = SpriteCache("text", TEXT_CACHE_BYTES)
 
 
 class TextRenderer:
@@ -23,14 +34,13 @@ class TextRenderer:
     ):
         if font_path is None:
             # 使用默认字体
-            font_path = pkg_resources.resource_filename(
-                "shortcap", "assets/fonts/TitanOne-Regular.ttf"
-            )
+            font_path = "TitanOne-Regular.ttf"
 
-        if not os.path.exists(font_path):
+        try:
+            self.font_path = resolve_font(font_path)
+        except FontError:
             raise FileNotFoundError(f"Font file not found at {font_path}")
 
-        self.font_path = font_path
         self.font_size = font_size
         self.font_color = font_color
         self.stroke_width = stroke_width
@@ -67,57 +77,309 @@ class TextClipEx(TextClip):
         self.text: str = kwargs["txt"]
 
 
+class TextImageClip(ImageClip):
+    """ImageClip built from a Pillow-rasterized RGBA array, keeping its text."""
+
+    def __init__(self, rgba: numpy.ndarray, text: str):
+        super().__init__(rgba)
+        self.text: str = text
+
+
+def parse_color(color: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    if color is None or color == "transparent":
+        return None
+    return ImageColor.getrgb(color)[:3]
+
+
+def compose_layers(
+    fill_mask: numpy.ndarray,
+    stroke_mask: Optional[numpy.ndarray],
+    fill_rgb: numpy.ndarray,
+    stroke_rgb: Optional[Tuple[int, int, int]],
+    opacity: float = 1.0,
+) -> numpy.ndarray:
+    """Composite a fill coverage mask over a stroke coverage mask into RGBA.
+
+    `fill_rgb` is either one color or an array broadcastable to the mask
+    with a trailing channel axis (e.g. one color per column).
+    """
+    fill_alpha = fill_mask.astype(numpy.float32) / 255
+    fill_rgb = numpy.asarray(fill_rgb, dtype=numpy.float32)
+
+    if stroke_mask is None or stroke_rgb is None:
+        alpha = fill_alpha
+        rgb = numpy.broadcast_to(fill_rgb, fill_mask.shape + (3,))
+    else:
+        stroke_alpha = stroke_mask.astype(numpy.float32) / 255
+        alpha = fill_alpha + stroke_alpha * (1 - fill_alpha)
+        stroke_weight = stroke_alpha * (1 - fill_alpha)
+        rgb = (
+            fill_rgb * fill_alpha[..., None]
+            + numpy.asarray(stroke_rgb, dtype=numpy.float32) * stroke_weight[..., None]
+        ) / numpy.maximum(alpha, 1e-6)[..., None]
+
+    rgba = numpy.empty(fill_mask.shape + (4,), dtype=numpy.uint8)
+    rgba[..., :3] = numpy.clip(rgb + 0.5, 0, 255)
+    rgba[..., 3] = numpy.clip(alpha * (255 * opacity) + 0.5, 0, 255)
+    return rgba
+
+
+def rasterize_text(
+    text: str,
+    fontsize: int,
+    color: str,
+    font: str,
+    bg_color: str = "transparent",
+    opacity: float = 1.0,
+    stroke_color: Optional[str] = None,
+    stroke_width: int = 1,
+    kerning: float = 0.0,
+) -> numpy.ndarray:
+    """Draw text with Pillow into an RGBA array, without spawning ImageMagick."""
+    pil_font = load_font(font, fontsize)
+    size = text_canvas_size(pil_font, text, stroke_width, kerning)
+    stroke_rgb = parse_color(stroke_color)
+
+    fill_img = Image.new("L", size)
+    stroke_img = Image.new("L", size) if stroke_rgb and stroke_width else None
+
+    # Pillow has no letter spacing, so extra kerning means placing glyphs by hand
+    if kerning:
+        runs = []
+        x = stroke_width
+        for char in text:
+            runs.append((x, char))
+            x += pil_font.getlength(char) + kerning
+    else:
+        runs = [(stroke_width, text)]
+
+    fill_draw = ImageDraw.Draw(fill_img)
+    stroke_draw = ImageDraw.Draw(stroke_img) if stroke_img else None
+    for x, run in runs:
+        fill_draw.text((x, stroke_width), run, font=pil_font, fill=255)
+        if stroke_draw:
+            stroke_draw.text(
+                (x, stroke_width),
+                run,
+                font=pil_font,
+                fill=255,
+                stroke_width=stroke_width,
+                stroke_fill=255,
+            )
+
+    rgba = compose_layers(
+        numpy.asarray(fill_img),
+        numpy.asarray(stroke_img) if stroke_img else None,
+        parse_color(color),
+        stroke_rgb,
+        opacity,
+    )
+
+    return apply_background(rgba, bg_color)
+
+
+def apply_background(rgba: numpy.ndarray, bg_color: str) -> numpy.ndarray:
+    bg_rgb = parse_color(bg_color)
+    if bg_rgb:
+        alpha = rgba[..., 3:].astype(numpy.float32) / 255
+        rgba[..., :3] = rgba[..., :3] * alpha + numpy.array(bg_rgb) * (1 - alpha)
+        rgba[..., 3] = 255
+    return rgba
+
+
+class LineRaster:
+    """A line of words rasterized once, then recolored per highlighted word.
+
+    The line is drawn into a fill and a stroke coverage mask and every
+    column is labelled with the index of the word it belongs to (spaces
+    are split between their neighbours). A highlight state is a palette
+    lookup by word index, blended with weights computed once per line.
+    """
+
+    def __init__(
+        self,
+        words: List[str],
+        fontsize: int,
+        font: str,
+        stroke_width: int = 1,
+        stroke_color: Optional[str] = None,
+    ):
+        pil_font = load_font(font, fontsize)
+        text = " ".join(words)
+        size = text_canvas_size(pil_font, text, stroke_width)
+        self.words = words
+        self.size = size
+
+        fill_img = Image.new("L", size)
+        ImageDraw.Draw(fill_img).text(
+            (stroke_width, stroke_width), text, font=pil_font, fill=255
+        )
+        self.fill_mask = numpy.asarray(fill_img)
+
+        fill_alpha = self.fill_mask.astype(numpy.float32) / 255
+        stroke_rgb = parse_color(stroke_color)
+        if stroke_rgb and stroke_width:
+            stroke_img = Image.new("L", size)
+            ImageDraw.Draw(stroke_img).text(
+                (stroke_width, stroke_width),
+                text,
+                font=pil_font,
+                fill=255,
+                stroke_width=stroke_width,
+                stroke_fill=255,
+            )
+            stroke_alpha = numpy.asarray(stroke_img).astype(numpy.float32) / 255
+            stroke_alpha *= 1 - fill_alpha
+        else:
+            stroke_rgb = (0, 0, 0)
+            stroke_alpha = numpy.zeros_like(fill_alpha)
+
+        # Fill over stroke: alpha = fa + sa * (1 - fa), colors weighted by alpha
+        alpha = fill_alpha + stroke_alpha
+        self.alpha = alpha
+        safe_alpha = numpy.maximum(alpha, 1e-6)
+        self.fill_weight = (fill_alpha / safe_alpha)[..., None]
+        self.stroke_rgb = (stroke_alpha / safe_alpha)[..., None] * numpy.array(
+            stroke_rgb, dtype=numpy.float32
+        )
+
+        # Word index of every column, split at the middle of each space
+        boundaries = []
+        x = stroke_width
+        for i, word in enumerate(words[:-1]):
+            word_end = x + pil_font.getlength(word)
+            x = stroke_width + pil_font.getlength(" ".join(words[: i + 1]) + " ")
+            boundaries.append((word_end + x) / 2)
+        self.labels = numpy.searchsorted(
+            boundaries, numpy.arange(size[0]) + 0.5, side="right"
+        )
+
+    def render(
+        self,
+        color: str,
+        highlight_index: int = -1,
+        highlight_color: Optional[str] = None,
+        opacity: float = 1.0,
+    ) -> numpy.ndarray:
+        palette = numpy.empty((len(self.words), 3), dtype=numpy.float32)
+        palette[:] = parse_color(color)
+        if 0 <= highlight_index < len(self.words) and highlight_color:
+            palette[highlight_index] = parse_color(highlight_color)
+
+        rgba = numpy.empty(self.alpha.shape + (4,), dtype=numpy.uint8)
+        rgba[..., :3] = self.fill_weight * palette[self.labels] + self.stroke_rgb + 0.5
+        rgba[..., 3] = self.alpha * (255 * opacity) + 0.5
+        return rgba
+
+
+def clip_to_rgba(clip: VideoClip, t: float = 0) -> numpy.ndarray:
+    """Read a clip frame and its mask into one RGBA array, in memory."""
+    rgb = clip.get_frame(t)
+    if clip.mask is None:
+        alpha = numpy.full(rgb.shape[:2], 255, dtype=numpy.uint8)
+    else:
+        alpha = (clip.mask.get_frame(t) * 255 + 0.5).astype(numpy.uint8)
+    return numpy.dstack((rgb.astype(numpy.uint8), alpha))
+
+
 def moviepy_to_pillow(clip: VideoClip) -> Image.Image:
     try:
-        temp_file = tempfile.NamedTemporaryFile(suffix=".png").name
-        clip.save_frame(temp_file)
-        image = Image.open(temp_file)
-        return image
+        return Image.fromarray(clip_to_rgba(clip), "RGBA")
     except Exception as e:
         logger.error(f"Failed to convert MoviePy clip to Pillow image: {str(e)}")
         raise RuntimeError(f"Failed to convert MoviePy clip to Pillow image: {str(e)}")
 
 
 def get_text_size(
-    text: str, fontsize: int, font: str, stroke_width: int
+    text: str,
+    fontsize: int,
+    font: str,
+    stroke_width: int,
+    backend: str = DEFAULT_TEXT_BACKEND,
 ) -> Tuple[int, int]:
+    if backend == "pillow":
+        return measure_text(text, font, fontsize, stroke_width)
     text_clip = create_text(
-        text, fontsize=fontsize, color="white", font=font, stroke_width=stroke_width
+        text,
+        fontsize=fontsize,
+        color="white",
+        font=font,
+        stroke_width=stroke_width,
+        backend=backend,
     )
     return text_clip.size
 
 
 def get_text_size_ex(
-    text: str, font: str, fontsize: int, stroke_width: int
+    text: str,
+    font: str,
+    fontsize: int,
+    stroke_width: int,
+    backend: str = DEFAULT_TEXT_BACKEND,
 ) -> Tuple[int, int]:
+    if backend == "pillow":
+        return measure_text(text, font, fontsize, stroke_width)
     text_clip = create_text_ex(
-        text, fontsize=fontsize, color="white", font=font, stroke_width=stroke_width
+        text,
+        fontsize=fontsize,
+        color="white",
+        font=font,
+        stroke_width=stroke_width,
+        backend=backend,
     )
     return text_clip.size
 
 
-def blur_text_clip(text_clip: VideoClip, blur_radius: int) -> VideoClip:
-    # Convert TextClip to a PIL image
-    pil_img = moviepy_to_pillow(text_clip)
-
+def pad_for_blur(image: numpy.ndarray, blur_radius: int) -> numpy.ndarray:
     # Offset blur to make it centered
-    offset = int(blur_radius * 0.6)
+    offset = blur_radius + int(blur_radius * 0.6)
 
-    # Add empty space around text for blur
-    pil_img_padded = Image.new(
-        "RGBA", (pil_img.width + blur_radius * 3, pil_img.height + blur_radius * 3)
-    )
-    pil_img_padded.paste(
-        moviepy_to_pillow(text_clip), (blur_radius + offset, blur_radius + offset)
+    # Add empty space around the image for blur
+    height, width = image.shape[:2]
+    padded = numpy.zeros(
+        (height + blur_radius * 3, width + blur_radius * 3) + image.shape[2:],
+        dtype=numpy.uint8,
     )
+    padded[offset : offset + height, offset : offset + width] = image
+    return padded
 
-    # Create a blurred version of the text
-    pil_img_padded = pil_img_padded.filter(ImageFilter.GaussianBlur(radius=blur_radius))
 
-    text_clip = ImageClip(numpy.array(pil_img_padded))
-    text_clip = text_clip.set_duration(text_clip.duration)
+def blur_rgba(rgba: numpy.ndarray, blur_radius: int) -> numpy.ndarray:
+    # Blur premultiplied so transparent pixels don't bleed their color
+    image = Image.fromarray(pad_for_blur(rgba, blur_radius), "RGBA").convert("RGBa")
+    image = image.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+    return numpy.array(image.convert("RGBA"))
 
-    return text_clip
+
+def render_shadow(
+    alpha: numpy.ndarray,
+    blur_radius: int,
+    color: Tuple[int, int, int] = (0, 0, 0),
+    opacity: float = 1.0,
+) -> numpy.ndarray:
+    """Blur a coverage mask into a single-color RGBA shadow.
+
+    Only the alpha channel is filtered. Pillow's Gaussian blur is a
+    separable box approximation whose cost doesn't grow with the radius,
+    and it runs without touching the filesystem, so shadows can be made
+    from several threads at once.
+    """
+    mask = Image.fromarray(pad_for_blur(alpha, blur_radius), "L")
+    mask = numpy.asarray(mask.filter(ImageFilter.GaussianBlur(radius=blur_radius)))
+
+    shadow = numpy.empty(mask.shape + (4,), dtype=numpy.uint8)
+    shadow[..., :3] = color
+    if opacity == 1:
+        shadow[..., 3] = mask
+    else:
+        shadow[..., 3] = mask * opacity + 0.5
+    return shadow
+
+
+def blur_text_clip(text_clip: VideoClip, blur_radius: int) -> VideoClip:
+    return TextImageClip(
+        blur_rgba(clip_to_rgba(text_clip), blur_radius), getattr(text_clip, "text", "")
+    )
 
 
 def create_text(
@@ -131,44 +393,69 @@ def create_text(
     stroke_color: Optional[str] = None,
     stroke_width: int = 1,
     kerning: float = 0.0,
+    backend: str = DEFAULT_TEXT_BACKEND,
 ) -> VideoClip:
-    global text_cache
+    if backend not in TEXT_BACKENDS:
+        raise ValueError(f"Invalid text backend: {backend}")
+
+    key = (
+        text,
+        fontsize,
+        color,
+        font,
+        bg_color,
+        blur_radius,
+        opacity,
+        stroke_color,
+        stroke_width,
+        kerning,
+        backend,
+    )
 
-    arg_hash = hash(
-        (
+    cached_clip = text_cache.get(key)
+    if cached_clip is not None:
+        return cached_clip.copy()
+
+    if backend == "pillow" and not kerning:
+        rgba = compose_text(
+            [(char, parse_color(color)) for char in text],
+            fontsize,
+            font,
+            parse_color(stroke_color),
+            stroke_width,
+            opacity,
+        )
+        text_clip = TextImageClip(apply_background(rgba, bg_color), text)
+    elif backend == "pillow":
+        rgba = rasterize_text(
             text,
             fontsize,
             color,
             font,
             bg_color,
-            blur_radius,
             opacity,
             stroke_color,
             stroke_width,
             kerning,
         )
-    )
-
-    if arg_hash in text_cache:
-        return text_cache[arg_hash].copy()
-
-    text_clip = TextClipEx(
-        txt=text,
-        fontsize=fontsize,
-        color=color,
-        bg_color=bg_color,
-        font=font,
-        stroke_color=stroke_color,
-        stroke_width=stroke_width,
-        kerning=kerning,
-    )
-
-    text_clip = text_clip.set_opacity(opacity)
+        text_clip = TextImageClip(rgba, text)
+    else:
+        text_clip = TextClipEx(
+            txt=text,
+            fontsize=fontsize,
+            color=color,
+            bg_color=bg_color,
+            font=font,
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+            kerning=kerning,
+        )
+        text_clip = text_clip.set_opacity(opacity)
 
     if blur_radius:
         text_clip = blur_text_clip(text_clip, blur_radius)
 
-    text_cache[arg_hash] = text_clip.copy()
+    text_cache.put(key, text_clip.copy())
 
     return text_clip
 
@@ -184,58 +471,113 @@ def create_text_chars(
     stroke_color: Optional[str] = None,
     stroke_width: int = 1,
     add_space_between_words: bool = True,
+    backend: str = DEFAULT_TEXT_BACKEND,
 ) -> List[VideoClip]:
     # Create a clip for each character
     clips = []
+    for char in flatten_chars(text, add_space_between_words):
+        clip = create_text(
+            char.text,
+            fontsize,
+            char.color or color,
+            font,
+            bg_color,
+            blur_radius,
+            opacity,
+            stroke_color,
+            stroke_width,
+            backend=backend,
+        )
+        clips.append(clip)
+
+    return clips
+
+
+def flatten_chars(
+    text: Union[List[Word], List[Character]], add_space_between_words: bool = True
+) -> List[Character]:
+    chars = []
     for i, item in enumerate(text):
         if isinstance(item, Word):
-            chars = item.characters
+            chars.extend(item.characters)
             if add_space_between_words and i < len(text) - 1:
                 chars.append(Character(" ", item.color))
         else:
-            chars = [item]
-
-        for char in chars:
-            clip = create_text(
-                char.text,
-                fontsize,
-                char.color or color,
-                font,
-                bg_color,
-                blur_radius,
-                opacity,
-                stroke_color,
-                stroke_width,
-            )
-            clips.append(clip)
-
-    return clips
+            chars.append(item)
+    return chars
+
+
+def crop_to_alpha(rgba: numpy.ndarray) -> Optional[Tuple[numpy.ndarray, int, int]]:
+    """Crop an RGBA array to its visible pixels, returning it with its (x, y) offset."""
+    alpha = rgba[..., 3]
+    rows = numpy.flatnonzero(alpha.any(axis=1))
+    cols = numpy.flatnonzero(alpha.any(axis=0))
+    if not len(rows):
+        return None
+    top, left = int(rows[0]), int(cols[0])
+    return rgba[top : rows[-1] + 1, left : cols[-1] + 1], left, top
+
+
+def flatten_rgba(
+    pieces: List[Tuple[numpy.ndarray, int, int]], size: Tuple[int, int]
+) -> numpy.ndarray:
+    """Alpha-composite RGBA pieces at (x, y) offsets, in order, into one canvas.
+
+    Only the pixels each piece covers are touched; pieces are clipped to
+    the canvas.
+    """
+    width, height = size
+    # Premultiplied color and alpha, in [0, 1]
+    canvas = numpy.zeros((height, width, 4), dtype=numpy.float32)
+
+    for rgba, x, y in pieces:
+        left, top = max(x, 0), max(y, 0)
+        right = min(x + rgba.shape[1], width)
+        bottom = min(y + rgba.shape[0], height)
+        if right <= left or bottom <= top:
+            continue
+
+        src = rgba[top - y : bottom - y, left - x : right - x].astype(numpy.float32)
+        src /= 255
+        src[..., :3] *= src[..., 3:]
+        dst = canvas[top:bottom, left:right]
+        dst *= 1 - src[..., 3:]
+        dst += src
+
+    flat = numpy.empty((height, width, 4), dtype=numpy.uint8)
+    alpha = canvas[..., 3:]
+    flat[..., :3] = canvas[..., :3] / numpy.maximum(alpha, 1e-6) * 255 + 0.5
+    flat[..., 3:] = alpha * 255 + 0.5
+    return flat
 
 
 def create_composite_text(
     text_clips: List[VideoClip], font: str, font_size: int
-) -> CompositeVideoClip:
-    clips = []
+) -> VideoClip:
+    """Lay character clips out along a line and flatten them into one RGBA clip.
 
-    font = ImageFont.truetype(font, font_size)
-    scale_factor = 3.012  # factor to convert Pillow to MoviePy width
+    Each character keeps only its visible pixels and offset, so the cost
+    of the line doesn't grow with the number of characters times its width.
+    """
+    face = get_face(font, font_size)
 
-    full_width = 0
-    for clip in text_clips[:-1]:
-        width = font.getlength(clip.text) * scale_factor
-        full_width += width
+    pieces = []
+    offset_x = 0.0
+    for clip in text_clips:
+        cropped = crop_to_alpha(clip_to_rgba(clip))
+        if cropped is not None:
+            rgba, left, top = cropped
+            pieces.append((rgba, int(offset_x) + left, top))
+        offset_x += face.advance(clip.text)
 
+    full_width = 0.0
+    for clip in text_clips[:-1]:
+        full_width += face.advance(clip.text)
     full_width += text_clips[-1].size[0]
-    offset_x = 0
-
-    for clip in text_clips:
-        clip.size = (int(full_width), clip.size[1])
-        clip = clip.set_position((int(offset_x), 0))
-        width = font.getlength(clip.text)
-        offset_x += width * scale_factor
-        clips.append(clip)
+    height = max(clip.size[1] for clip in text_clips)
 
-    return CompositeVideoClip(clips)
+    text = "".join(clip.text for clip in text_clips)
+    return TextImageClip(flatten_rgba(pieces, (int(full_width), height)), text)
 
 
 def str_to_charlist(text: str) -> List[Character]:
@@ -253,9 +595,29 @@ def create_text_ex(
     stroke_color: Optional[str] = None,
     stroke_width: int = 1,
     kerning: float = 0,
-) -> CompositeVideoClip:
+    backend: str = DEFAULT_TEXT_BACKEND,
+) -> VideoClip:
     if isinstance(text, str):
         text = str_to_charlist(text)
+
+    # Blit the whole line from the glyph atlases instead of one clip per character
+    if backend == "pillow":
+        chars = flatten_chars(text)
+        rgba = compose_text(
+            [(char.text, parse_color(char.color or color)) for char in chars],
+            fontsize,
+            font,
+            parse_color(stroke_color),
+            stroke_width,
+            opacity,
+        )
+        text_clip = TextImageClip(
+            apply_background(rgba, bg_color), "".join(char.text for char in chars)
+        )
+        if blur_radius:
+            text_clip = blur_text_clip(text_clip, blur_radius)
+        return text_clip
+
     text_clips = create_text_chars(
         text,
         fontsize,
@@ -266,5 +628,6 @@ def create_text_ex(
         opacity,
         stroke_color,
         stroke_width,
+        backend=backend,
     )
-    return create_composite_text(text_clips, font, fontsize // 3)
+    return create_composite_text(text_clips, font, fontsize)
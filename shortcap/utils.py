@@ -1,15 +1,28 @@
-import os
+import json
 import subprocess
-from moviepy.editor import VideoClip
-from .text_renderer import create_text_ex, blur_text_clip
-from typing import List, Tuple, Dict, Any, Callable, Optional
+import tempfile
+import numpy
+from fractions import Fraction
+from moviepy.editor import ImageClip, VideoClip
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+from .text_renderer import create_text_ex, clip_to_rgba, render_shadow
+from .cache import SpriteCache, cached
+from .config import (
+    DEFAULT_TEXT_BACKEND,
+    ENCODING_PROFILES,
+    LAYOUT_CACHE_BYTES,
+    SHADOW_CACHE_BYTES,
+)
+from .fonts import FontError, measure_text, resolve_font
+from .line_breaker import LineFitter, get_line_breaker
+from typing import List, Tuple, Dict, Any, Optional, Union
 import logging
-from functools import lru_cache
 
 logger = logging.getLogger("shortcap.utils")
 
-shadow_cache = {}
-lines_cache = {}
+lines_cache = SpriteCache("lines", LAYOUT_CACHE_BYTES)
+shadow_cache = SpriteCache("shadow", SHADOW_CACHE_BYTES)
+text_size_cache = SpriteCache("text_size", LAYOUT_CACHE_BYTES)
 
 
 def populate_tabs(segments):
@@ -156,91 +169,351 @@ def ffmpeg(command: List[str]) -> subprocess.CompletedProcess:
         raise RuntimeError(f"FFmpeg command failed: {e.stderr}")
 
 
-def get_font_path(font: str) -> str:
-    """Get the full path to a font file."""
-    if os.path.exists(font):
-        return font
+def filter_escape(value: str) -> str:
+    """Escape a value for a filter option in an ffmpeg filtergraph.
 
-    # 如果是系统字体名称，直接返回
-    if font in ["Arial", "Helvetica"]:
-        return font
+    The graph parser unescapes the value once and the filter's option
+    parser once more, so it's escaped for both levels, innermost first.
+    """
+    for special in ("\\':", "\\'[],;"):
+        value = "".join("\\" + char if char in special else char for char in value)
+    return value
+
+
+def ffprobe(video_file: str) -> Dict[str, Any]:
+    """Probe the streams and container of a media file, as ffprobe's JSON."""
+    result = ffmpeg(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_streams",
+            "-show_format",
+            "-of",
+            "json",
+            video_file,
+        ]
+    )
+    return json.loads(result.stdout)
+
+
+def video_info(probe: Dict[str, Any]) -> Dict[str, Any]:
+    """Frame size (as displayed), frame rate, duration and audio presence of a probe."""
+    streams = probe.get("streams", [])
+    video_streams = [s for s in streams if s.get("codec_type") == "video"]
+    if not video_streams:
+        raise ValueError("No video stream found")
+    stream = video_streams[0]
+
+    width, height = int(stream["width"]), int(stream["height"])
+    rotation = int(stream.get("tags", {}).get("rotate", 0))
+    for side_data in stream.get("side_data_list", []):
+        rotation = int(side_data.get("rotation", rotation))
+    if rotation % 180:
+        width, height = height, width
+
+    fps = 0.0
+    for rate in (stream.get("avg_frame_rate"), stream.get("r_frame_rate")):
+        if rate and not rate.endswith("/0") and Fraction(rate) > 0:
+            fps = float(Fraction(rate))
+            break
+
+    duration = float(
+        probe.get("format", {}).get("duration") or stream.get("duration") or 0
+    )
 
-    raise FileNotFoundError(f"Font not found: {font}")
+    return {
+        "size": (width, height),
+        "fps": fps,
+        "duration": duration,
+        "has_audio": any(s.get("codec_type") == "audio" for s in streams),
+        "video_stream": stream,
+    }
+
+
+def probe_video(video_file: str) -> Dict[str, Any]:
+    """`video_info` of a video, from ffprobe or, without it, from MoviePy.
+
+    MoviePy parses ffmpeg's log, which has no codec details, so the
+    fallback's `video_stream` is empty (the smart renderer then
+    re-encodes everything).
+    """
+    try:
+        return video_info(ffprobe(video_file))
+    except FileNotFoundError:
+        logger.warning("ffprobe not found, reading video metadata with MoviePy")
+
+    infos = ffmpeg_parse_infos(video_file)
+    if not infos.get("video_found"):
+        raise ValueError("No video stream found")
+
+    width, height = infos["video_size"]
+    if infos.get("video_rotation", 0) % 180:
+        width, height = height, width
+    return {
+        "size": (width, height),
+        "fps": float(infos.get("video_fps") or 0.0),
+        "duration": float(infos.get("duration") or 0.0),
+        "has_audio": bool(infos.get("audio_found")),
+        "video_stream": {},
+    }
+
+
+def encoder_params(profile: str) -> List[str]:
+    """ffmpeg options of an ENCODING_PROFILES entry besides its codec and preset."""
+    if profile not in ENCODING_PROFILES:
+        raise ValueError(f"Invalid encoding profile: {profile}")
+    settings = ENCODING_PROFILES[profile]
+
+    params = ["-pix_fmt", "yuv420p"]
+    if "crf" in settings:
+        params += ["-crf", str(settings["crf"])]
+    if "threads" in settings:
+        params += ["-threads", str(settings["threads"])]
+    if settings["codec"] == "libx265":
+        # Lets Apple players recognise HEVC in MP4
+        params += ["-tag:v", "hvc1"]
+    return params
+
+
+def encoder_args(profile: str) -> List[str]:
+    """ffmpeg output options encoding video with an ENCODING_PROFILES entry."""
+    params = encoder_params(profile)
+    settings = ENCODING_PROFILES[profile]
+    args = ["-c:v", settings["codec"]]
+    if "preset" in settings:
+        args += ["-preset", str(settings["preset"])]
+    return args + params
+
+
+def mux_audio(video_only_file: str, audio_source: str, output_file: str) -> None:
+    """Copy the audio of `audio_source` untouched next to an encoded video stream."""
+    ffmpeg(
+        [
+            "ffmpeg",
+            "-y",
+            "-i",
+            video_only_file,
+            "-i",
+            audio_source,
+            "-map",
+            "0:v",
+            "-map",
+            "1:a?",
+            "-c",
+            "copy",
+            output_file,
+        ]
+    )
+
+
+def _ffmpeg_process(command: List[str], **streams: Any) -> subprocess.Popen:
+    # ffmpeg logs to a temporary file instead of a pipe: nobody reads a
+    # pipe while frames stream, and a full one (say, from a damaged input's
+    # decoder errors) would block ffmpeg and the renderer with it
+    log = tempfile.TemporaryFile()
+    process = subprocess.Popen(command, stderr=log, **streams)
+    process.log = log  # type: ignore[attr-defined]
+    return process
+
+
+def ffmpeg_reader(command: List[str]) -> subprocess.Popen:
+    """Start an ffmpeg process whose output is read from its stdout."""
+    return _ffmpeg_process(command, stdout=subprocess.PIPE)
+
+
+def ffmpeg_writer(command: List[str]) -> subprocess.Popen:
+    """Start an ffmpeg process whose input is written to its stdin."""
+    return _ffmpeg_process(command, stdin=subprocess.PIPE)
+
+
+def read_frame(process: subprocess.Popen, frame: numpy.ndarray) -> bool:
+    """Fill `frame` in place from an ffmpeg reader; False once the stream ends."""
+    view = memoryview(frame).cast("B")
+    filled = 0
+    while filled < len(view):
+        count = process.stdout.readinto(view[filled:])
+        if not count:
+            if filled:
+                logger.warning("FFmpeg stream ended in the middle of a frame")
+            return False
+        filled += count
+    return True
+
+
+def ffmpeg_wait(process: subprocess.Popen) -> None:
+    """Close a streaming ffmpeg process and raise if it failed."""
+    if process.stdin:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass  # Already exited; the return code tells why
+    if process.stdout:
+        process.stdout.close()
+    returncode = process.wait()
+    log = process.log  # type: ignore[attr-defined]
+    with log:
+        log.seek(0)
+        stderr = log.read().decode(errors="replace")
+    if returncode != 0:
+        logger.error(f"FFmpeg command failed: {stderr}")
+        raise RuntimeError(f"FFmpeg command failed: {stderr}")
+
+
+def get_font_path(font: str) -> str:
+    """Get the full path to a font file."""
+    # Paths, bundled font names and system font names (Arial, Helvetica)
+    try:
+        return resolve_font(font)
+    except FontError:
+        raise FileNotFoundError(f"Font not found: {font}")
 
 
 def fits_frame(
     line_count: int, font: str, font_size: int, stroke_width: int, text_bbox_width: int
-) -> Callable[[str], bool]:
-    def fit_function(text):
-        lines = calculate_lines(text, font, font_size, stroke_width, text_bbox_width)
-        return len(lines["lines"]) <= line_count
-
-    return fit_function
+) -> LineFitter:
+    breaker = get_line_breaker(font, font_size, stroke_width, text_bbox_width)
+    return LineFitter(breaker, line_count)
 
 
-@lru_cache(maxsize=1024)
+@cached(lines_cache)
 def calculate_lines(
     text: str, font: str, font_size: int, stroke_width: int, text_bbox_width: int
 ) -> Dict[str, Any]:
-    lines = []
-
-    line_to_draw = None
-    line = ""
+    breaker = get_line_breaker(font, font_size, stroke_width, text_bbox_width)
     words = text.split()
-    word_index = 0
-    total_height = 0
-    while word_index < len(words):
-        word = words[word_index]
-        line += word + " "
-        text_size = get_text_size_ex(line.strip(), font, font_size, stroke_width)
-        text_width = text_size[0]
-        line_height = text_size[1]
-
-        if text_width < text_bbox_width:
-            line_to_draw = {
-                "text": line.strip(),
-                "height": line_height,
-            }
-            word_index += 1
-        else:
-            if not line_to_draw:
-                logger.warning(f"Word '{line.strip()}' is too long for the frame!")
-                line_to_draw = {
-                    "text": line.strip(),
-                    "height": line_height,
-                }
-                word_index += 1
-
-            lines.append(line_to_draw)
-            total_height += line_height
-            line_to_draw = None
-            line = ""
-
-    if line_to_draw:
-        lines.append(line_to_draw)
-        total_height += line_height
+
+    lines = [
+        {
+            "text": " ".join(words[start:end]),
+            "height": breaker.line_height,
+        }
+        for start, end in breaker.break_lines(words)
+    ]
 
     return {
         "lines": lines,
-        "height": total_height,
+        "height": breaker.line_height * len(lines),
     }
 
 
-@lru_cache(maxsize=1024)
+def layout_caption(
+    caption: Dict[str, Any],
+    font: str,
+    font_size: int,
+    stroke_width: int,
+    text_bbox_width: int,
+    video_height: int,
+    position: Union[int, str],
+    padding: int,
+    highlight_current_word: bool,
+) -> Dict[str, Any]:
+    """Lay out a caption: its lines, where they go and when each word is highlighted.
+
+    Every line gets the highlight states to draw it with: intervals and
+    the index (within the line) of the highlighted word, or -1.
+    Consecutive states that highlight nothing on a line look the same, so
+    they are merged.
+    """
+    line_data = calculate_lines(
+        caption["text"], font, font_size, stroke_width, text_bbox_width
+    )
+
+    # Vertical alignment
+    if isinstance(position, int):
+        text_y_offset = position
+    elif position == "center":
+        text_y_offset = video_height // 2 - line_data["height"] // 2
+    elif position == "top":
+        text_y_offset = padding
+    elif position == "bottom":
+        text_y_offset = video_height - line_data["height"] - padding
+    else:
+        raise ValueError("Invalid vertical position.")
+
+    # Generate word-timed highlight states like ASS's \k tags. Each state
+    # lasts until the next word starts so the line never blinks out.
+    highlight_states = []
+    if highlight_current_word:
+        for i, word in enumerate(caption["words"]):
+            end = (
+                caption["words"][i + 1]["start"]
+                if i + 1 < len(caption["words"])
+                else caption["end"]
+            )
+            highlight_states.append({"start": word["start"], "end": end, "index": i})
+    else:
+        highlight_states.append(
+            {"start": caption["start"], "end": caption["end"], "index": -1}
+        )
+
+    # Index of the caption word each token of the caption text belongs to
+    word_indices = [
+        i for i, word in enumerate(caption["words"]) for _ in word["word"].split()
+    ]
+    token_offset = 0
+
+    lines = []
+    y = text_y_offset
+    for line in line_data["lines"]:
+        line_words = line["text"].split()
+        line_word_indices = word_indices[token_offset : token_offset + len(line_words)]
+
+        line_states = []
+        for state in highlight_states:
+            highlighted = (
+                line_word_indices.index(state["index"])
+                if state["index"] in line_word_indices
+                else -1
+            )
+            if line_states and line_states[-1]["index"] == highlighted:
+                line_states[-1]["end"] = state["end"]
+            else:
+                line_states.append({**state, "index": highlighted})
+
+        lines.append(
+            {
+                "text": line["text"],
+                "words": line_words,
+                "y": y,
+                "height": line["height"],
+                "states": line_states,
+            }
+        )
+        token_offset += len(line_words)
+        y += line["height"]
+
+    return {"y": text_y_offset, "lines": lines}
+
+
+@cached(shadow_cache)
 def create_shadow(
     text: str, font_size: int, font: str, blur_radius: float, opacity: float = 1.0
 ) -> VideoClip:
-    shadow = create_text_ex(text, font_size, "black", font, opacity=opacity)
-    shadow = blur_text_clip(shadow, int(font_size * blur_radius))
-    return shadow
+    text_clip = create_text_ex(text, font_size, "black", font)
+    alpha = clip_to_rgba(text_clip)[..., 3]
+    shadow = render_shadow(alpha, int(font_size * blur_radius), opacity=opacity)
+    return ImageClip(shadow)
 
 
-@lru_cache(maxsize=1024)
+@cached(text_size_cache)
 def get_text_size_ex(
-    text: str, font: str, fontsize: int, stroke_width: int
+    text: str,
+    font: str,
+    fontsize: int,
+    stroke_width: int,
+    backend: str = DEFAULT_TEXT_BACKEND,
 ) -> Tuple[int, int]:
+    # Font metrics give the rendered size without rasterizing anything
+    if backend == "pillow":
+        return measure_text(text, font, fontsize, stroke_width)
     text_clip = create_text_ex(
-        text, fontsize=fontsize, color="white", font=font, stroke_width=stroke_width
+        text,
+        fontsize=fontsize,
+        color="white",
+        font=font,
+        stroke_width=stroke_width,
+        backend=backend,
     )
     return text_clip.size
 
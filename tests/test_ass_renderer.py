@@ -0,0 +1,91 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from shortcap.ass_renderer import build_ass, burn_ass
+from shortcap.utils import filter_escape
+
+SCRIPT = """[Script Info]
+ScriptType: v4.00+
+PlayResX: 64
+PlayResY: 64
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, \
+BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, \
+BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,40,&H00FFFFFF,&H00FFFFFF,&H00000000,&H00000000,0,0,0,0,100,\
+100,0,0,1,2,0,5,0,0,0,1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:00.00,0:00:01.00,Default,,0,0,0,,OK
+"""
+
+
+CAPTION = {
+    "text": "hello world",
+    "start": 0.0,
+    "end": 1.0,
+    "words": [
+        {"word": "hello", "start": 0.0, "end": 0.5},
+        {"word": "world", "start": 0.5, "end": 1.0},
+    ],
+}
+
+
+def shadow_alphas(shadow_strength):
+    script = build_ass(
+        [CAPTION],
+        720,
+        1280,
+        "SourceSans3-Black.ttf",
+        60,
+        "white",
+        2,
+        "black",
+        True,
+        "yellow",
+        40,
+        "center",
+        shadow_strength,
+        0.1,
+    )
+    events = [line for line in script.splitlines() if line.startswith("Dialogue: 0,")]
+    return [event.split("\\1a&H")[1][:2] for event in events]
+
+
+@pytest.mark.parametrize(
+    "shadow_strength, alphas",
+    [(0, []), (0.5, ["80"]), (1, ["00"]), (2, ["00", "00"]), (2.25, ["00", "00", "BF"])],
+)
+def test_one_shadow_event_per_unit_of_strength(shadow_strength, alphas):
+    assert shadow_alphas(shadow_strength) == alphas
+
+
+def test_filter_escape_escapes_both_levels():
+    assert filter_escape("a:b") == "a\\\\:b"
+    assert filter_escape("a'b") == "a\\\\\\'b"
+    assert filter_escape("a,b[c];d") == "a\\,b\\[c\\]\\;d"
+    assert filter_escape("plain/path.ass") == "plain/path.ass"
+
+
+@pytest.mark.skipif(not shutil.which("ffmpeg"), reason="needs ffmpeg")
+def test_burn_ass_with_special_characters_in_paths(tmp_path):
+    directory = tmp_path / "it's a: [test], really; \\o/"
+    directory.mkdir()
+    video_file = str(tmp_path / "input.mp4")
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", "color=s=64x64:d=0.2"]
+        + ["-c:v", "libx264", "-pix_fmt", "yuv420p", video_file],
+        check=True,
+    )
+    subtitles_file = directory / "sub's:1.ass"
+    subtitles_file.write_text(SCRIPT)
+    output_file = str(tmp_path / "output.mp4")
+
+    burn_ass(video_file, str(subtitles_file), output_file, str(directory), "draft")
+
+    assert os.path.getsize(output_file) > 0
@@ -0,0 +1,92 @@
+import numpy
+import pytest
+
+from shortcap.caption_layer import CaptionLayer, Sprite, premultiply
+
+WIDTH, HEIGHT = 160, 90
+
+
+def random_sprites(generator, count):
+    sprites = []
+    for _ in range(count):
+        height, width = generator.integers(4, 60, 2)
+        image = generator.integers(0, 256, (height, width, 4), dtype=numpy.uint8)
+        # Fully transparent and fully opaque areas, like text and its shadow
+        image[..., 3][image[..., 3] < 64] = 0
+        image[..., 3][image[..., 3] > 192] = 255
+        start = float(generator.uniform(0, 4))
+        sprites.append(
+            Sprite(
+                image,
+                int(generator.integers(-20, WIDTH)),
+                int(generator.integers(-20, HEIGHT)),
+                start,
+                start + float(generator.uniform(0.1, 2)),
+            )
+        )
+    return sprites
+
+
+def composite(frame, sprites, t):
+    """Straight alpha "over" in floating point, one sprite after the other."""
+    result = frame.astype(numpy.float64)
+    for sprite in sprites:
+        if not sprite.start <= t < sprite.end:
+            continue
+        height, width = sprite.image.shape[:2]
+        left, top = max(sprite.x, 0), max(sprite.y, 0)
+        right = min(sprite.x + width, WIDTH)
+        bottom = min(sprite.y + height, HEIGHT)
+        if right <= left or bottom <= top:
+            continue
+        source = sprite.image[
+            top - sprite.y : bottom - sprite.y, left - sprite.x : right - sprite.x
+        ].astype(numpy.float64)
+        alpha = source[..., 3:] / 255
+        region = result[top:bottom, left:right]
+        region[:] = region * (1 - alpha) + source[..., :3] * alpha
+    return result
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_blend_matches_float_compositing(seed):
+    generator = numpy.random.default_rng(seed)
+    sprites = random_sprites(generator, 12)
+    background = generator.integers(0, 256, (HEIGHT, WIDTH, 3), dtype=numpy.uint8)
+    layer = CaptionLayer(sprites)
+
+    for t in numpy.linspace(0, 6, 40):
+        frame = background.copy()
+        blended = layer.blend(frame, float(t))
+
+        assert blended is frame
+        # Overlapping sprites are pre-blended in 8-bit, so errors add up a little
+        difference = numpy.abs(blended - composite(background, sprites, t))
+        assert difference.max() < 2.5
+        assert difference.mean() < 0.2
+
+
+def test_premultiplied_sprites_blend_the_same():
+    generator = numpy.random.default_rng(0)
+    sprites = random_sprites(generator, 6)
+    prepared = []
+    for sprite in sprites:
+        cropped = premultiply(sprite)
+        premultiplied = (
+            (cropped.image, cropped.x - sprite.x, cropped.y - sprite.y)
+            if cropped is not None
+            else (numpy.zeros((0, 0, 4), dtype=numpy.uint8), 0, 0)
+        )
+        prepared.append(sprite._replace(premultiplied=premultiplied))
+    background = generator.integers(0, 256, (HEIGHT, WIDTH, 3), dtype=numpy.uint8)
+
+    for t in numpy.linspace(0, 6, 20):
+        expected = CaptionLayer(sprites).blend(background.copy(), float(t))
+        actual = CaptionLayer(prepared).blend(background.copy(), float(t))
+        assert numpy.array_equal(actual, expected)
+
+
+def test_no_sprites_leave_the_frame_alone():
+    frame = numpy.full((HEIGHT, WIDTH, 3), 7, dtype=numpy.uint8)
+
+    assert numpy.all(CaptionLayer([]).blend(frame, 1.0) == 7)
@@ -0,0 +1,49 @@
+import numpy
+import pytest
+
+from shortcap.emoji_pack import EmojiPack, EmojiPackError, get_pack, write_emoji_pack
+from shortcap.emojis import get_lexicon
+
+
+def random_emojis(count):
+    generator = numpy.random.default_rng(0)
+    return {
+        emoji_id: generator.integers(0, 256, (8 + emoji_id, 5 + emoji_id, 4)).astype(
+            numpy.uint8
+        )
+        for emoji_id in range(1, count + 1)
+    }
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_pack_round_trip(tmp_path, compress):
+    emojis = random_emojis(5)
+    path = str(tmp_path / "emojis.pack")
+
+    assert write_emoji_pack(reversed(list(emojis.items())), path, compress) == 5
+
+    pack = EmojiPack(path)
+    assert sorted(pack) == sorted(emojis)
+    for emoji_id, rgba in emojis.items():
+        assert emoji_id in pack and str(emoji_id) in pack
+        assert numpy.array_equal(pack.rgba(str(emoji_id)), rgba)
+        assert not pack.rgba(emoji_id).flags.writeable
+
+
+def test_missing_emojis_and_bad_files(tmp_path):
+    path = tmp_path / "emojis.pack"
+    write_emoji_pack(random_emojis(1).items(), str(path))
+
+    with pytest.raises(EmojiPackError):
+        EmojiPack(str(path)).rgba(2)
+    assert "x" not in EmojiPack(str(path))
+
+    path.write_bytes(b"not a pack at all")
+    with pytest.raises(EmojiPackError):
+        EmojiPack(str(path))
+
+
+def test_shipped_pack_has_every_emoji_with_keywords():
+    pack = get_pack()
+    assert all(row[0] in pack for row in get_lexicon().rows if row[3])
+    assert pack.rgba(515).shape[2] == 4
@@ -0,0 +1,49 @@
+import pytest
+
+from shortcap.emoji_vectors import EmojiVectors, stem
+from shortcap.emojis import get_emoji_index, get_emoji_vectors
+
+
+@pytest.mark.parametrize(
+    "forms",
+    [
+        ("dog", "dogs"),
+        ("puppy", "puppies"),
+        ("box", "boxes"),
+        ("watch", "watches"),
+        ("dance", "dancing", "danced"),
+        ("run", "running"),
+        ("stop", "stopped"),
+    ],
+)
+def test_inflections_share_a_stem(forms):
+    assert len({stem(word) for word in forms}) == 1
+
+
+@pytest.mark.parametrize("word", ["glass", "bus", "sing", "thing", "red", "need"])
+def test_stem_leaves_other_words_alone(word):
+    assert stem(word) == word
+
+
+@pytest.mark.parametrize("word", ["dog", "cat", "bird", "horse", "rocket", "tree", "flower", "car"])
+def test_plurals_match_the_emoji_of_their_keyword(word):
+    emoji = get_emoji_index().match([word])
+    assert emoji is not None
+
+    vectors = get_emoji_vectors()
+    assert vectors.match([word, word + "s", f"look at those {word}s"]) == [emoji] * 3
+
+
+def test_last_of_equally_similar_words_wins():
+    vectors = EmojiVectors(["1", "2"], ["pizza", "rocket"])
+
+    assert vectors.match(["rockets and pizzas", "no match here", ""]) == [
+        "1",
+        None,
+        None,
+    ]
+
+
+@pytest.mark.parametrize("word", ["other", "others", "back", "another", "often"])
+def test_words_only_match_keywords_they_begin_with(word):
+    assert get_emoji_vectors().match([word, f"the {word} one"]) == [None, None]
@@ -0,0 +1,59 @@
+import random
+
+from shortcap import emojis
+from shortcap.emojis import (
+    EmojiIndex,
+    get_emoji_index,
+    normalize_words,
+    remove_punctuation_and_whitespace,
+)
+
+
+def scan_lexicon(sentence):
+    """The lookup shortcap used before EmojiIndex: every word against every keyword."""
+    found = None
+    for word in sentence.split(" "):
+        word_clean = remove_punctuation_and_whitespace(word)
+        for number, keywords in emojis.flatten_emojis_array:
+            for keyword in keywords:
+                if keyword.lower() == word_clean:
+                    found = number
+    return found
+
+
+def random_sentences(count):
+    # Keywords with punctuation ("three-thirty") only ever matched the index
+    written = {
+        keyword.lower()
+        for _, keywords in emojis.flatten_emojis_array
+        for keyword in keywords
+    }
+    keywords = sorted(written & set(get_emoji_index().keywords))
+    filler = "the and i you really so much, wow! today we're going to see".split()
+    generator = random.Random(0)
+    for _ in range(count):
+        words = generator.choices(keywords, k=2) + generator.choices(filler, k=4)
+        generator.shuffle(words)
+        yield " ".join(words)
+
+
+def test_keywords_match_like_the_lexicon_scan():
+    # Phrases aside, which the scan never matched
+    index = EmojiIndex(get_emoji_index().keywords, {})
+    for sentence in random_sentences(100):
+        assert index.match(normalize_words(sentence)) == scan_lexicon(sentence)
+
+
+def test_no_keywords_no_emoji():
+    sentence = "the and i you really so much"
+
+    assert get_emoji_index().match(normalize_words(sentence)) is None
+    assert scan_lexicon(sentence) is None
+
+
+def test_longest_phrase_wins_over_its_words():
+    index = EmojiIndex.build([("1", ["south"]), ("2", ["south africa"])])
+
+    assert index.match(normalize_words("Welcome to South Africa!")) == "2"
+    assert index.match(normalize_words("down south")) == "1"
+    assert index.match(normalize_words("south, then africa")) == "1"
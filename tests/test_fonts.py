@@ -0,0 +1,24 @@
+import math
+
+from shortcap.fonts import advance_cache, get_face, measure_text
+
+FONT = "SourceSans3-Black.ttf"
+
+
+def test_only_characters_and_words_are_cached():
+    advance_cache.clear()
+    face = get_face(FONT, 40)
+
+    assert face.advance("word") == face.font.getlength("word")
+    assert face.advance("a whole line") == face.font.getlength("a whole line")
+    measure_text("another whole line", FONT, 40, 2)
+
+    assert [key[2] for key in advance_cache.entries] == ["word"]
+
+
+def test_measure_text_matches_the_font():
+    face = get_face(FONT, 40)
+    width, height = measure_text("hello world", FONT, 40, 2)
+
+    assert width == math.ceil(face.font.getlength("hello world")) + 4
+    assert height == face.ascent + face.descent + 4
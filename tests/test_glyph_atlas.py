@@ -0,0 +1,32 @@
+import string
+
+from shortcap.glyph_atlas import atlas_cache, get_atlas
+
+STYLE = ("SourceSans3-Black.ttf", 120, 4, (255, 255, 255), (0, 0, 0))
+
+
+def test_atlas_is_accounted_again_only_when_it_grows():
+    atlas_cache.clear()
+    atlas = get_atlas(*STYLE)
+    small = atlas_cache.bytes
+
+    for char in string.ascii_letters + string.digits:
+        atlas.glyph(char)
+
+    assert atlas.texture.nbytes > small
+    assert atlas_cache.bytes >= atlas.texture.nbytes
+
+    accounted = atlas_cache.bytes
+    assert get_atlas(*STYLE) is atlas
+    assert atlas_cache.bytes == accounted
+
+
+def test_evicted_atlas_isnt_stored_back_when_it_grows():
+    atlas_cache.clear()
+    atlas = get_atlas(*STYLE)
+    atlas_cache.clear()
+
+    for char in string.ascii_letters:
+        atlas.glyph(char)
+
+    assert len(atlas_cache) == 0
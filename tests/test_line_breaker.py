@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from shortcap.fonts import measure_text
+from shortcap.line_breaker import LineBreaker, LineFitter
+
+FONT = "SourceSans3-Black.ttf"
+WORDS = (
+    "the quick brown fox jumps over a lazy dog We're AV To Ya wait, really? "
+    "incredible Wow!! yes no T.V. 2024 WAVE Typography"
+).split()
+
+
+def greedy_lines(words, font_size, stroke_width, text_bbox_width):
+    """The breaker shortcap used before LineBreaker: measure every candidate line."""
+    lines, line = [], []
+    i = 0
+    while i < len(words):
+        candidate = line + [words[i]]
+        width, _ = measure_text(" ".join(candidate), FONT, font_size, stroke_width)
+        if width < text_bbox_width:
+            line = candidate
+            i += 1
+            continue
+        # A word too long for the frame gets a line of its own
+        lines.append(line or candidate)
+        i += not line
+        line = []
+    if line:
+        lines.append(line)
+    return [" ".join(line) for line in lines]
+
+
+def random_cases(count):
+    generator = random.Random(0)
+    for _ in range(count):
+        words = [generator.choice(WORDS) for _ in range(generator.randint(1, 15))]
+        yield (
+            words,
+            generator.choice([30, 50, 72]),
+            generator.choice([0, 2, 4]),
+            generator.randint(150, 700),
+        )
+
+
+def test_breaks_like_the_greedy_breaker():
+    for words, font_size, stroke_width, text_bbox_width in random_cases(300):
+        breaker = LineBreaker(FONT, font_size, stroke_width, text_bbox_width)
+        lines = [
+            " ".join(words[start:end]) for start, end in breaker.break_lines(words)
+        ]
+
+        assert lines == greedy_lines(words, font_size, stroke_width, text_bbox_width)
+
+
+@pytest.mark.parametrize("line_count", [1, 2, 3])
+def test_incremental_fitter_agrees_with_full_layout(line_count):
+    breaker = LineBreaker(FONT, 50, 2, 400)
+    for words, *_ in random_cases(100):
+        fitter = LineFitter(breaker, line_count)
+        caption = []
+        for word in words:
+            assert fitter.fits(word) == fitter(" ".join(caption + [word]))
+            if not fitter.fits(word):
+                break
+            fitter.append(word)
+            caption.append(word)
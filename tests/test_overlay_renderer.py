@@ -0,0 +1,38 @@
+import shutil
+import subprocess
+import tempfile
+
+import numpy
+import pytest
+
+from shortcap.caption_layer import Sprite
+from shortcap.overlay_renderer import render_overlay
+
+
+@pytest.mark.skipif(not shutil.which("ffmpeg"), reason="needs ffmpeg")
+def test_render_overlay_with_special_characters_in_paths(tmp_path, monkeypatch):
+    directory = tmp_path / "it's a: [test], really; \\o"
+    directory.mkdir()
+    # The sprite images are written to a temporary directory under it
+    monkeypatch.setattr(tempfile, "tempdir", str(directory))
+
+    video_file = str(tmp_path / "input.mp4")
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", "color=s=64x64:d=0.2"]
+        + ["-c:v", "libx264", "-pix_fmt", "yuv444p", video_file],
+        check=True,
+    )
+    output_file = str(tmp_path / "output.mp4")
+    white = numpy.full((16, 16, 4), 255, dtype=numpy.uint8)
+
+    render_overlay(video_file, output_file, [Sprite(white, 8, 8, 0.0, 1.0)], "draft")
+
+    frame = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", output_file, "-frames:v", "1"]
+        + ["-f", "rawvideo", "-pix_fmt", "gray", "-"],
+        capture_output=True,
+        check=True,
+    ).stdout
+    frame = numpy.frombuffer(frame, dtype=numpy.uint8).reshape(64, 64)
+    assert frame[16, 16] > 200
+    assert frame[40, 40] < 50
@@ -0,0 +1,93 @@
+import os
+import shutil
+
+import numpy
+import pytest
+
+from shortcap.caption_layer import Sprite
+from shortcap.smart_renderer import (
+    Keyframe,
+    encoder_profile,
+    plan_spans,
+    probe_keyframes,
+)
+
+DEMO_VIDEO = os.path.join(os.path.dirname(__file__), "..", "demo", "anyme.mp4")
+
+H264_STREAM = {
+    "codec_name": "h264",
+    "pix_fmt": "yuv420p",
+    "profile": "Main",
+    "level": 30,
+    "width": 360,
+    "height": 640,
+}
+
+
+def sprite(start, end):
+    return Sprite(numpy.full((4, 4, 4), 255, dtype=numpy.uint8), 0, 0, start, end)
+
+
+def test_spans_start_on_exact_keyframe_times():
+    fps = 30000 / 1001
+    keyframes = [Keyframe(0.0, 0), Keyframe(5.505505, 165), Keyframe(11.011011, 330)]
+
+    spans = plan_spans([sprite(6.0, 7.0)], keyframes, fps, 442)
+
+    assert [(s.start_frame, s.end_frame, s.captioned) for s in spans] == [
+        (0, 165, False),
+        (165, 330, True),
+        (330, 442, False),
+    ]
+    assert [(s.start_time, s.end_time) for s in spans] == [
+        (0.0, 5.505505),
+        (5.505505, 11.011011),
+        (11.011011, None),
+    ]
+
+
+def test_spans_merge_neighbouring_gops():
+    keyframes = [Keyframe(float(t), t * 25) for t in range(4)]
+
+    spans = plan_spans([sprite(1.5, 2.5)], keyframes, 25.0, 100)
+
+    assert [(s.start_frame, s.end_frame, s.captioned) for s in spans] == [
+        (0, 25, False),
+        (25, 75, True),
+        (75, 100, False),
+    ]
+    assert spans[1].end_time == 3.0
+
+
+def test_encoder_profile_matches_the_source():
+    assert encoder_profile(H264_STREAM) == ["-profile:v", "main", "-level", "30"]
+    assert encoder_profile(dict(H264_STREAM, profile="Constrained Baseline"))[1] == (
+        "baseline"
+    )
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [
+        dict(H264_STREAM, codec_name="hevc"),
+        dict(H264_STREAM, pix_fmt="yuv420p10le"),
+        dict(H264_STREAM, profile="High 10"),
+        dict(H264_STREAM, tags={"rotate": "90"}),
+        dict(H264_STREAM, side_data_list=[{"rotation": -90}]),
+    ],
+)
+def test_encoder_profile_rejects_streams_that_cant_be_copied(stream):
+    assert encoder_profile(stream) is None
+
+
+@pytest.mark.skipif(
+    not shutil.which("ffprobe") or not os.path.exists(DEMO_VIDEO),
+    reason="needs ffprobe and the demo video",
+)
+def test_probe_keyframes_of_demo_video():
+    keyframes = probe_keyframes(DEMO_VIDEO)
+
+    assert keyframes[0] == Keyframe(0.0, 0)
+    # GOPs of 165 frames at 29.97 fps, timed from the packets themselves
+    assert [k.frame for k in keyframes] == [0, 165, 330]
+    assert keyframes[1].time == pytest.approx(165 / 29.97, abs=1e-9)
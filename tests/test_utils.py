@@ -0,0 +1,69 @@
+import os
+import shutil
+import sys
+
+import numpy
+import pytest
+
+from shortcap import utils
+from shortcap.utils import ffmpeg_reader, ffmpeg_wait, ffmpeg_writer, read_frame
+
+DEMO_VIDEO = os.path.join(os.path.dirname(__file__), "..", "demo", "anyme.mp4")
+
+
+def python(code):
+    return [sys.executable, "-c", code]
+
+
+def test_reader_logging_more_than_a_pipe_holds_doesnt_block():
+    # Like a damaged input: megabytes of decoder errors before the frames
+    reader = ffmpeg_reader(
+        python(
+            "import sys\n"
+            "sys.stderr.write('error\\n' * 500000)\n"
+            "sys.stdout.buffer.write(bytes(range(12)))"
+        )
+    )
+    frame = numpy.empty((2, 2, 3), dtype=numpy.uint8)
+
+    assert read_frame(reader, frame)
+    assert frame.ravel().tolist() == list(range(12))
+    assert not read_frame(reader, frame)
+    ffmpeg_wait(reader)
+
+
+def test_failures_report_the_log():
+    reader = ffmpeg_reader(python("import sys; sys.exit('no such file')"))
+
+    with pytest.raises(RuntimeError, match="no such file"):
+        ffmpeg_wait(reader)
+
+
+def test_writer_gets_its_input():
+    writer = ffmpeg_writer(
+        python("import sys; assert sys.stdin.buffer.read() == b'frame'")
+    )
+    writer.stdin.write(b"frame")
+
+    ffmpeg_wait(writer)
+
+
+@pytest.mark.skipif(
+    not shutil.which("ffprobe") or not os.path.exists(DEMO_VIDEO),
+    reason="needs ffprobe and the demo video",
+)
+def test_probe_falls_back_to_moviepy_without_ffprobe(monkeypatch):
+    probed = utils.probe_video(DEMO_VIDEO)
+
+    def missing(video_file):
+        raise FileNotFoundError("ffprobe")
+
+    monkeypatch.setattr(utils, "ffprobe", missing)
+    fallback = utils.probe_video(DEMO_VIDEO)
+
+    assert fallback["size"] == probed["size"]
+    # MoviePy reads a rounded rate (29.97 as 30000/1001) from the log
+    assert fallback["fps"] == pytest.approx(probed["fps"], abs=0.01)
+    assert fallback["duration"] == pytest.approx(probed["duration"], abs=0.05)
+    assert fallback["has_audio"] == probed["has_audio"]
+    assert fallback["video_stream"] == {}